@@ -54,8 +54,11 @@ def main() -> bool:
 
     settings = get_settings()
     logger.info(f"Working directory: {script_dir}")
-    logger.info(f"Whisper model: {settings.audio.whisper_model}")
-    logger.info(f"Question classifier: {settings.analysis.question_model}")
+    logger.info(
+        f"Whisper model: {settings.audio.whisper_model} "
+        f"({settings.audio.whisper_backend} backend)"
+    )
+    logger.info(f"Question classifier: {settings.analysis.question_model_binary}")
 
     # Clean previous runs
     cleanup_folders(script_dir)
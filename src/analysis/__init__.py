@@ -1,17 +1,35 @@
-"""Analysis modules for interview processing."""
+"""Analysis modules for interview processing.
 
-from .sentiment import analyze_sentiment, analyze_emotion, analyze_text
-from .question_classifier import classify_question, is_question
-from .speaker_mapper import map_speakers, get_speaker_role
-from .qa_pairer import pair_questions_answers
+Re-exports are resolved lazily (PEP 562) so importing ``src.analysis``
+does not pull in torch/transformers/pysentimiento until a symbol is
+actually used.
+"""
 
-__all__ = [
-    "analyze_sentiment",
-    "analyze_emotion",
-    "analyze_text",
-    "classify_question",
-    "is_question",
-    "map_speakers",
-    "get_speaker_role",
-    "pair_questions_answers",
-]
+_EXPORTS = {
+    "analyze_sentiment": "sentiment",
+    "analyze_emotion": "sentiment",
+    "analyze_text": "sentiment",
+    "analyze_sentiment_batch": "sentiment",
+    "analyze_emotion_batch": "sentiment",
+    "analyze_text_batch": "sentiment",
+    "warmup": "sentiment",
+    "classify_question": "question_classifier",
+    "classify_questions": "question_classifier",
+    "is_question": "question_classifier",
+    "map_speakers": "speaker_mapper",
+    "get_speaker_role": "speaker_mapper",
+    "pair_questions_answers": "qa_pairer",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        from importlib import import_module
+
+        module = import_module(f".{_EXPORTS[name]}", __name__)
+        value = getattr(module, name)
+        globals()[name] = value  # cache so __getattr__ runs once per symbol
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
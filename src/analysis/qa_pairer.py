@@ -23,11 +23,13 @@
         - Empty answer text is skipped during pairing
         - Questions are linked to their first non-empty answer
         - Multiple answers can be paired to a single question
+        - A single left-to-right sweep carries the open question along, so
+          pairing is O(N) with no per-question re-scan
     """
 
 import logging
 
-from src.models.analysis import AnalyzedSegment
+from src.models.analysis import AnalyzedSegment, Role, SpeakerRole
 
 logger = logging.getLogger(__name__)
 
@@ -37,33 +39,27 @@ def pair_questions_answers(segments: list[AnalyzedSegment]) -> list[AnalyzedSegm
     if not segments:
         return segments
 
-    i = 0
-    while i < len(segments):
-        seg = segments[i]
-        if seg.speaker_role == "Interviewer" and seg.role == "question":
-            question_id = seg.segment_id
-            first_answer_id = None
-
-            j = i + 1
-            while j < len(segments) and segments[j].speaker_role != "Interviewer":
-                answer = segments[j]
-                if answer.text.strip():
-                    answer.paired_with = question_id
-                    logger.debug(
-                        f"Paired answer {answer.segment_id} -> question {question_id}"
-                    )
-                    if first_answer_id is None:
-                        first_answer_id = answer.segment_id
-                j += 1
-
-            if first_answer_id:
-                seg.paired_with = first_answer_id
-                logger.debug(
-                    f"Paired question {question_id} -> first answer {first_answer_id}"
-                )
-
-            i = j
-        else:
-            i += 1
+    # One pass: interviewer questions open an answer block, any other
+    # interviewer segment closes it, interviewee segments join the open one
+    last_question: AnalyzedSegment | None = None
+    paired_questions = 0
+    paired_answers = 0
+
+    for seg in segments:
+        if seg.speaker_role is SpeakerRole.INTERVIEWER:
+            # Every interviewer turn closes the open block — even an empty
+            # one (too-short clips transcribe to ""); questions open a new one
+            last_question = seg if seg.role is Role.QUESTION else None
+        elif last_question is not None and seg.text.strip():
+            seg.paired_with = last_question.segment_id
+            if last_question.paired_with is None:
+                last_question.paired_with = seg.segment_id
+                paired_questions += 1
+            paired_answers += 1
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Paired %d answers to %d questions", paired_answers, paired_questions
+        )
 
     return segments
@@ -0,0 +1,84 @@
+"""Low-precision helpers for CPU transformer inference.
+
+Args:
+    model: a loaded torch nn.Module to quantize in-place-style
+
+Returns:
+    The reduced-precision module, or the original module if conversion fails.
+
+Raises:
+    None. Conversion errors are logged and the FP32 model is kept.
+
+Note:
+    - On CPUs with native BF16 kernels (AVX-512/AMX via oneDNN) the whole
+      model is cast to bfloat16 for ~2x GEMM throughput at half bandwidth
+    - Elsewhere falls back to dynamic INT8 on nn.Linear (the hot matmuls)
+    - Gated by settings.analysis.quantize at the call sites
+    - configure_torch_threads pins torch to the physical core count once
+      and relaxes float32 matmul precision so TF32/BF16 kernels are eligible
+"""
+
+import logging
+import os
+from functools import lru_cache
+
+import torch
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=1)
+def configure_torch_threads() -> int:
+    # Hyperthreads rarely help GEMM-bound inference; use physical cores
+    physical_cores = max(1, (os.cpu_count() or 2) // 2)
+    torch.set_num_threads(physical_cores)
+    torch.set_float32_matmul_precision("medium")
+    logger.debug("torch threads set to %d", physical_cores)
+    return physical_cores
+
+
+@lru_cache(maxsize=1)
+def _cpu_supports_bf16() -> bool:
+    try:
+        capability = torch.backends.cpu.get_cpu_capability()
+    except AttributeError:  # older torch without the probe
+        return False
+    return (
+        torch.backends.mkldnn.is_available()
+        and capability in {"AVX512", "AMX"}
+    )
+
+
+def compile_model(model):
+    """Wrap the model with torch.compile for fused, dispatch-free kernels.
+
+    Opt-in via settings.analysis.torch_compile: the first forward pays the
+    Inductor compile, which only amortizes on long interviews.
+    """
+    try:
+        compiled = torch.compile(model, mode="reduce-overhead")
+        logger.info("Compiled model with torch.compile (reduce-overhead)")
+        return compiled
+    except Exception as e:
+        logger.warning(f"torch.compile unavailable, keeping eager model: {e}")
+        return model
+
+
+def quantize_model(model):
+    if _cpu_supports_bf16():
+        try:
+            converted = model.to(torch.bfloat16)
+            logger.info("Cast model to BF16 for native CPU kernels")
+            return converted
+        except Exception as e:
+            logger.warning(f"BF16 cast failed, trying INT8: {e}")
+
+    try:
+        quantized = torch.quantization.quantize_dynamic(
+            model, {torch.nn.Linear}, dtype=torch.qint8
+        )
+        logger.info("Applied dynamic INT8 quantization to nn.Linear layers")
+        return quantized
+    except Exception as e:
+        logger.warning(f"Dynamic quantization failed, keeping FP32 model: {e}")
+        return model
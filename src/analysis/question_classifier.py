@@ -1,5 +1,5 @@
 """ Moduke for classifying text segments as questions or statements.
-   Provides functions to classify text using a zero-shot classification model.
+   Provides functions to classify text using a binary text-classification model.
 
    Args:
        text: the input text segment to classify
@@ -12,10 +12,12 @@
         None. Assumes valid input text.
 
     Note:
-        - Uses transformers pipeline for zero-shot classification
+        - Uses transformers pipeline for binary text classification
+        - A distilled 2-class head needs one forward pass per text, instead of
+          one NLI pass per candidate label as with zero-shot classification
         - Caches classifier instances for performance
         - Classification threshold is configurable via settings
-        - Default candidate labels are "question" and "statement"
+        - Model labels are mapped to "question" / "statement" via LABEL_MAP
 
     Example:
         >>> role, score = classify_question("¿Cómo te llamas?"
@@ -23,39 +25,198 @@
 
 
 import logging
-from functools import lru_cache
+import re
+import threading
 
 from transformers import pipeline
 
+from src.analysis.quantization import (
+    compile_model,
+    configure_torch_threads,
+    quantize_model,
+)
+from src.analysis.result_cache import load_cached, store_cached
 from src.config.settings import get_settings
 
 logger = logging.getLogger(__name__)
 
 
-CANDIDATE_LABELS = ["question", "statement"]
+# Label names used by binary question/statement checkpoints
+LABEL_MAP = {"LABEL_0": "statement", "LABEL_1": "question"}
+
+# Obvious questions: opening ¿ / interrogative word, or a trailing ?
+_QUESTION_RE = re.compile(
+    r"^\s*(¿|qué\b|cómo\b|por qué\b|cuál\b|cuándo\b|dónde\b|quién\b|cuánto\b)"
+    r"|\?\s*$",
+    re.IGNORECASE,
+)
+
+_heuristic_stats = {"hits": 0, "calls": 0}
+
+
+def _build_onnx_classifier(model_name: str):
+    """Build the classifier on ONNX Runtime with full graph optimization.
+
+    Raises ImportError when the optional `optimum[onnxruntime]` extra is not
+    installed; callers fall back to the PyTorch backend.
+    """
+    import onnxruntime
+    from optimum.onnxruntime import ORTModelForSequenceClassification
+    from transformers import AutoTokenizer
+
+    session_options = onnxruntime.SessionOptions()
+    session_options.graph_optimization_level = (
+        onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+    )
+    session_options.intra_op_num_threads = configure_torch_threads()
+
+    model = ORTModelForSequenceClassification.from_pretrained(
+        model_name,
+        export=True,
+        provider="CPUExecutionProvider",
+        session_options=session_options,
+    )
+    tokenizer = AutoTokenizer.from_pretrained(model_name)
+    return pipeline(
+        "text-classification", model=model, tokenizer=tokenizer, top_k=None, device=-1
+    )
+
+
+# Classifier singleton; the lock only guards construction
+_classifier = None
+_classifier_lock = threading.Lock()
 
 
-@lru_cache(maxsize=1)
 def _get_classifier():
+    global _classifier
+    if _classifier is not None:
+        return _classifier
+
+    with _classifier_lock:
+        if _classifier is None:
+            _classifier = _load_classifier()
+
+    return _classifier
+
+
+def _load_classifier():
     settings = get_settings()
-    model_name = settings.analysis.question_model
+    model_name = settings.analysis.question_model_binary
     logger.info(f"Loading question classifier: {model_name}")
-    return pipeline("zero-shot-classification", model=model_name)
+
+    if settings.analysis.use_onnx:
+        try:
+            classifier = _build_onnx_classifier(model_name)
+            logger.info("Question classifier running on ONNX Runtime")
+            return classifier
+        except ImportError:
+            logger.warning(
+                "optimum[onnxruntime] not installed, using PyTorch backend"
+            )
+        except Exception as e:
+            logger.warning(f"ONNX export failed, using PyTorch backend: {e}")
+
+    classifier = pipeline("text-classification", model=model_name, top_k=None, device=-1)
+
+    if settings.analysis.quantize:
+        configure_torch_threads()
+        classifier.model = quantize_model(classifier.model)
+    if settings.analysis.torch_compile:
+        classifier.model = compile_model(classifier.model)
+
+    return classifier
+
+
+def _postprocess(scores: list[dict], threshold: float) -> tuple[str, float]:
+    ranked = sorted(scores, key=lambda entry: entry["score"], reverse=True)
+    top_role = LABEL_MAP.get(ranked[0]["label"], ranked[0]["label"])
+    top_score = ranked[0]["score"]
+
+    if top_role == "question" and top_score >= threshold:
+        return "question", top_score
+
+    return "statement", ranked[1]["score"] if top_role == "question" else top_score
 
 
 def classify_question(text: str) -> tuple[str, float]:
-    classifier = _get_classifier()
+    _heuristic_stats["calls"] += 1
+    if _QUESTION_RE.search(text):
+        _heuristic_stats["hits"] += 1
+        logger.debug(
+            "Question heuristic hit rate: %d/%d",
+            _heuristic_stats["hits"], _heuristic_stats["calls"],
+        )
+        return "question", 1.0
+
     settings = get_settings()
 
-    result = classifier(text, candidate_labels=CANDIDATE_LABELS)
+    # The cache holds the raw label scores, not the thresholded decision:
+    # the role depends on thresholds.question_confidence, which the user can
+    # change between runs, so the threshold is re-applied on every load
+    cache_key = f"{settings.analysis.question_model_binary}:{text}"
+    scores = None
+    if settings.analysis.cache_results:
+        cached = load_cached("question", cache_key)
+        if cached is not None:
+            scores = cached.get("scores")
 
-    top_label = result["labels"][0]
-    top_score = result["scores"][0]
+    if scores is None:
+        classifier = _get_classifier()
+        scores = classifier(text)
+        if settings.analysis.cache_results:
+            store_cached("question", cache_key, {"scores": scores})
+
+    return _postprocess(scores, settings.thresholds.question_confidence)
 
-    if top_label == "question" and top_score >= settings.thresholds.question_confidence:
-        return "question", top_score
 
-    return "statement", result["scores"][1] if top_label == "question" else top_score
+def classify_questions(texts: list[str]) -> list[tuple[str, float]]:
+    """Classify a batch of texts, batching only the ones that need the model.
+
+    Heuristic hits and cached results are resolved up front; the remainder
+    goes through the pipeline in one call, which amortizes tokenization,
+    padding and per-call Python overhead across all segments.
+    """
+    if not texts:
+        return []
+
+    settings = get_settings()
+    use_cache = settings.analysis.cache_results
+    model_name = settings.analysis.question_model_binary
+    threshold = settings.thresholds.question_confidence
+
+    results: list = [None] * len(texts)
+    miss_idx = []
+    for idx, text in enumerate(texts):
+        _heuristic_stats["calls"] += 1
+        if _QUESTION_RE.search(text):
+            _heuristic_stats["hits"] += 1
+            results[idx] = ("question", 1.0)
+            continue
+        if use_cache:
+            # Cached entries hold raw scores; the threshold is re-applied
+            # here so a config change is honored on reruns
+            cached = load_cached("question", f"{model_name}:{text}")
+            if cached is not None and "scores" in cached:
+                results[idx] = _postprocess(cached["scores"], threshold)
+                continue
+        miss_idx.append(idx)
+
+    if miss_idx:
+        classifier = _get_classifier()
+        scores_list = classifier(
+            [texts[idx] for idx in miss_idx],
+            batch_size=settings.analysis.qc_batch_size,
+        )
+        for idx, scores in zip(miss_idx, scores_list):
+            results[idx] = _postprocess(scores, threshold)
+            if use_cache:
+                store_cached(
+                    "question",
+                    f"{model_name}:{texts[idx]}",
+                    {"scores": scores},
+                )
+
+    return results
 
 
 def is_question(text: str) -> bool:
@@ -0,0 +1,61 @@
+"""Disk-backed cache for per-text analysis results.
+
+Args:
+    kind (str): cache namespace ("sentiment", "emotion", "question")
+    key_material (str): model identifier plus input text, hashed into the key
+    payload (dict): JSON-serializable result to persist
+
+Returns:
+    dict | None: the cached payload, or None on a cache miss.
+
+Raises:
+    None. Cache I/O errors are logged and treated as misses.
+
+Note:
+    - Keys are blake2b(model_name + text) so results invalidate automatically
+      when the configured model changes
+    - Entries live under data/cache/<kind>/ and survive cleanup_folders,
+      so reruns over the same interview skip the transformer forward entirely
+    - Gated by settings.analysis.cache_results at the call sites
+"""
+
+import hashlib
+import logging
+from pathlib import Path
+
+from src.utils.json_io import dump_json, load_json
+
+logger = logging.getLogger(__name__)
+
+
+def _cache_root() -> Path:
+    return Path(__file__).parent.parent.parent / "data" / "cache"
+
+
+def _cache_path(kind: str, key_material: str) -> Path:
+    digest = hashlib.blake2b(
+        key_material.encode("utf-8"), digest_size=16
+    ).hexdigest()
+    return _cache_root() / kind / f"{digest}.json"
+
+
+def load_cached(kind: str, key_material: str) -> dict | None:
+    path = _cache_path(kind, key_material)
+    if not path.exists():
+        return None
+
+    try:
+        return load_json(path)
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable cache entry {path.name}: {e}")
+        return None
+
+
+def store_cached(kind: str, key_material: str, payload: dict) -> None:
+    path = _cache_path(kind, key_material)
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        dump_json(payload, path)
+    except Exception as e:
+        logger.warning(f"Failed to write cache entry {path.name}: {e}")
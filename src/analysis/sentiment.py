@@ -24,42 +24,197 @@ Example:
 """
 
 import logging
+import threading
+from dataclasses import asdict
 from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from pysentimiento import create_analyzer
 
+from src.analysis.quantization import (
+    compile_model,
+    configure_torch_threads,
+    quantize_model,
+)
+from src.analysis.result_cache import load_cached, store_cached
+from src.config.settings import get_settings
 from src.models.analysis import SentimentResult, EmotionResult
 
 logger = logging.getLogger(__name__)
 
 
-@lru_cache(maxsize=4)
+# Loaded analyzers are immutable; the lock only guards construction
+_analyzers: dict[tuple[str, str], object] = {}
+_analyzers_lock = threading.Lock()
+
+
 def _get_analyzer(task: str, lang: str):
-    logger.info(f"Loading {task} analyzer for language: {lang}")
-    return create_analyzer(task=task, lang=lang)
+    key = (task, lang)
+    analyzer = _analyzers.get(key)
+    if analyzer is not None:
+        return analyzer
+
+    with _analyzers_lock:
+        if key not in _analyzers:
+            logger.info(f"Loading {task} analyzer for language: {lang}")
+            analyzer = create_analyzer(task=task, lang=lang)
+
+            settings = get_settings()
+            if settings.analysis.quantize:
+                configure_torch_threads()
+                analyzer.model = quantize_model(analyzer.model)
+            if settings.analysis.torch_compile:
+                analyzer.model = compile_model(analyzer.model)
+
+            _analyzers[key] = analyzer
+
+    return _analyzers[key]
+
+
+def warmup(lang: str = "es") -> None:
+    """Preload the sentiment/emotion analyzers and the question classifier.
+
+    Loads run concurrently so the cold-start cost can be hidden behind
+    earlier pipeline stages instead of stalling the first segment.
+    """
+    from src.analysis.question_classifier import _get_classifier
+
+    tasks = {
+        "sentiment analyzer": lambda: _get_analyzer("sentiment", lang),
+        "emotion analyzer": lambda: _get_analyzer("emotion", lang),
+        "question classifier": _get_classifier,
+    }
+    with ThreadPoolExecutor(max_workers=len(tasks)) as pool:
+        futures = {pool.submit(loader): name for name, loader in tasks.items()}
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as e:
+                logger.warning(f"Warmup of {futures[future]} failed: {e}")
 
 
 def analyze_sentiment(text: str, lang: str = "es") -> SentimentResult:
+    cache_key = f"pysentimiento:sentiment:{lang}:{text}"
+    if get_settings().analysis.cache_results:
+        cached = load_cached("sentiment", cache_key)
+        if cached is not None:
+            return SentimentResult(**cached)
+
     analyzer = _get_analyzer("sentiment", lang)
     result = analyzer.predict(text)
 
-    return SentimentResult(
+    sentiment = SentimentResult(
         label=str(result.output),
         score=result.probas.get(str(result.output), 0.0),
         probabilities={str(k): float(v) for k, v in result.probas.items()},
     )
 
+    if get_settings().analysis.cache_results:
+        store_cached("sentiment", cache_key, asdict(sentiment))
+
+    return sentiment
+
 
 def analyze_emotion(text: str, lang: str = "es") -> EmotionResult:
+    cache_key = f"pysentimiento:emotion:{lang}:{text}"
+    if get_settings().analysis.cache_results:
+        cached = load_cached("emotion", cache_key)
+        if cached is not None:
+            return EmotionResult(**cached)
+
     analyzer = _get_analyzer("emotion", lang)
     result = analyzer.predict(text)
 
-    return EmotionResult(
+    emotion = EmotionResult(
         label=str(result.output),
         score=result.probas.get(str(result.output), 0.0),
         probabilities={str(k): float(v) for k, v in result.probas.items()},
     )
 
+    if get_settings().analysis.cache_results:
+        store_cached("emotion", cache_key, asdict(emotion))
 
-def analyze_text(text: str, lang: str = "es") -> tuple[SentimentResult, EmotionResult]:
+    return emotion
+
+
+def _result_from_prediction(prediction, result_cls):
+    return result_cls(
+        label=str(prediction.output),
+        score=prediction.probas.get(str(prediction.output), 0.0),
+        probabilities={str(k): float(v) for k, v in prediction.probas.items()},
+    )
+
+
+def _analyze_batch(task: str, result_cls, texts: list[str], lang: str) -> list:
+    """Run one analyzer over many texts, chunked by analyzer_batch_size.
+
+    Cached entries are filled in first; only the misses hit the model, in
+    list-sized predict calls that amortize tokenization and the forward pass.
+    """
+    settings = get_settings()
+    use_cache = settings.analysis.cache_results
+    batch_size = settings.analysis.analyzer_batch_size
+
+    results: list = [None] * len(texts)
+    # Repeated texts (filler answers, "yes", "ok") are predicted once and
+    # fanned out to every occurrence
+    miss_idx: dict[str, list[int]] = {}
+    for idx, text in enumerate(texts):
+        if use_cache:
+            cached = load_cached(task, f"pysentimiento:{task}:{lang}:{text}")
+            if cached is not None:
+                results[idx] = result_cls(**cached)
+                continue
+        miss_idx.setdefault(text, []).append(idx)
+
+    if miss_idx:
+        analyzer = _get_analyzer(task, lang)
+        # Length-sorted chunks keep padding waste down; results scatter
+        # back by index so the caller's order is preserved
+        misses = sorted(miss_idx, key=len)
+        for start in range(0, len(misses), batch_size):
+            chunk = misses[start:start + batch_size]
+            predictions = analyzer.predict(chunk)
+            for text, prediction in zip(chunk, predictions):
+                result = _result_from_prediction(prediction, result_cls)
+                for idx in miss_idx[text]:
+                    results[idx] = result
+                if use_cache:
+                    store_cached(
+                        task,
+                        f"pysentimiento:{task}:{lang}:{text}",
+                        asdict(result),
+                    )
+
+    return results
+
+
+def analyze_sentiment_batch(texts: list[str], lang: str = "es") -> list[SentimentResult]:
+    if not texts:
+        return []
+    return _analyze_batch("sentiment", SentimentResult, texts, lang)
+
+
+def analyze_emotion_batch(texts: list[str], lang: str = "es") -> list[EmotionResult]:
+    if not texts:
+        return []
+    return _analyze_batch("emotion", EmotionResult, texts, lang)
+
+
+def analyze_text_batch(
+    texts: list[str], lang: str = "es"
+) -> list[tuple[SentimentResult, EmotionResult]]:
+    return list(
+        zip(analyze_sentiment_batch(texts, lang), analyze_emotion_batch(texts, lang))
+    )
+
+
+@lru_cache(maxsize=4096)
+def _analyze_text_cached(text: str, lang: str) -> tuple[SentimentResult, EmotionResult]:
     return analyze_sentiment(text, lang), analyze_emotion(text, lang)
+
+
+def analyze_text(text: str, lang: str = "es") -> tuple[SentimentResult, EmotionResult]:
+    # Short phrases repeat constantly in interviews; the results are frozen
+    # dataclasses, so sharing one instance across occurrences is safe
+    return _analyze_text_cached(text, lang)
@@ -1,6 +1,7 @@
 import logging
 from collections import Counter
 
+from src.models.analysis import SpeakerRole
 from src.models.segment import TranscribedSegment
 
 logger = logging.getLogger(__name__)
@@ -19,7 +20,7 @@ logger = logging.getLogger(__name__)
     
     Note:
         - Maps least frequent speaker to "Interviewer" and others to "Interviewee"
-        - Uses Counter to count ocurrences of each speaker
+        - Counts ocurrences of each speaker in a single pass
         - Logs mapping decisions for transparency
         - If no segments provided, returns empty mapping. 
         
@@ -35,20 +36,23 @@ def map_speakers(segments: list[TranscribedSegment]) -> dict[str, str]:
     if not segments:
         return {}
 
-    speaker_counts = Counter(seg.speaker for seg in segments)
-    sorted_speakers = speaker_counts.most_common()
+    # Counter counts in C (_count_elements), one pass over the segments
+    counts = Counter(seg.speaker for seg in segments)
 
-    # Reverse: least frequent speaker first (interviewer)
-    sorted_speakers = sorted_speakers[::-1]
+    # Least frequent speaker is the interviewer; no sort needed
+    interviewer = min(counts, key=counts.get)
 
+    debug = logger.isEnabledFor(logging.DEBUG)
     speaker_map = {}
-    for i, (speaker, count) in enumerate(sorted_speakers):
-        if i == 0:
-            speaker_map[speaker] = "Interviewer"
-            logger.debug(f"Mapped {speaker} -> Interviewer ({count} segments)")
-        else:
-            speaker_map[speaker] = "Interviewee"
-            logger.debug(f"Mapped {speaker} -> Interviewee ({count} segments)")
+    for speaker, count in counts.items():
+        role = (
+            SpeakerRole.INTERVIEWER
+            if speaker == interviewer
+            else SpeakerRole.INTERVIEWEE
+        )
+        speaker_map[speaker] = role
+        if debug:
+            logger.debug("Mapped %s -> %s (%d segments)", speaker, role.value, count)
 
     return speaker_map
 
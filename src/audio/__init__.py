@@ -1,13 +1,28 @@
-from src.audio.converter import find_audio_file, convert_to_wav, ensure_wav_audio
-from src.audio.diarizer import diarize_audio
-from src.audio.segmenter import split_audio_segments
-from src.audio.transcriber import transcribe_segments
-
-__all__ = [
-    "find_audio_file",
-    "convert_to_wav",
-    "ensure_wav_audio",
-    "diarize_audio",
-    "split_audio_segments",
-    "transcribe_segments",
-]
+"""Audio processing modules.
+
+Re-exports are resolved lazily (PEP 562) so importing ``src.audio``
+does not load pyannote/soundfile/whisper until a symbol is actually used.
+"""
+
+_EXPORTS = {
+    "find_audio_file": "converter",
+    "convert_to_wav": "converter",
+    "ensure_wav_audio": "converter",
+    "diarize_audio": "diarizer",
+    "split_audio_segments": "segmenter",
+    "transcribe_segments": "transcriber",
+    "open_transcription_stream": "transcriber",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        from importlib import import_module
+
+        module = import_module(f".{_EXPORTS[name]}", __name__)
+        value = getattr(module, name)
+        globals()[name] = value  # cache so __getattr__ runs once per symbol
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,6 +1,6 @@
 """ Module for converting various audio formats to WAV.
     Provides functions to find audio files in supported formats
-    and convert them to WAV using pydub.
+    and convert them to WAV by piping through ffmpeg directly.
 
     Args:
         raw_dir (Path): directory to search for audio files
@@ -14,7 +14,9 @@
 
     Note:
         - Supports multiple audio formats defined in SUPPORTED_FORMATS
-        - uses pydub for audio conversion
+        - Invokes ffmpeg as a subprocess so decode/encode streams inside ffmpeg
+          instead of materializing the decoded audio in Python memory
+        - Output is mono at the configured sample rate (16 kHz for Whisper)
         - Creates target directories if they do not exist
         - Logs key steps and errors for transparency
         - If no supported audio file is found, logs an error with supported formats
@@ -27,13 +29,19 @@
         """
 
 import logging
+import os
+import subprocess
 from pathlib import Path
-from pydub import AudioSegment
+
+import soundfile as sf
+
+from src.config.settings import get_settings
 
 logger = logging.getLogger(__name__)
 
 
 SUPPORTED_FORMATS = {
+    ".wav": "wav",
     ".mp3": "mp3",
     ".m4a": "m4a",
     ".mp4": "mp4",
@@ -46,44 +54,125 @@ SUPPORTED_FORMATS = {
 }
 
 
+# Lower rank wins; mirrors the declaration order of SUPPORTED_FORMATS
+_FORMAT_PRIORITY = {ext: rank for rank, ext in enumerate(SUPPORTED_FORMATS)}
+
+
 def find_audio_file(raw_dir: Path) -> Path | None:
-    for ext in SUPPORTED_FORMATS:
-        candidates = list(raw_dir.glob(f"*{ext}"))
-        if candidates:
-            return candidates[0]
-    return None
+    best: Path | None = None
+    best_rank = len(_FORMAT_PRIORITY)
+
+    try:
+        with os.scandir(raw_dir) as entries:
+            for entry in entries:
+                # rfind on the raw name skips building a Path for non-matches
+                name = entry.name
+                dot = name.rfind(".")
+                if dot <= 0:
+                    continue
+                rank = _FORMAT_PRIORITY.get(name[dot:].lower())
+                if rank is None or rank >= best_rank or not entry.is_file():
+                    continue
+                best = Path(entry.path)
+                best_rank = rank
+    except FileNotFoundError:
+        # A missing raw_dir means "no audio found", like glob() treated it;
+        # the caller then logs the supported-formats hint and returns False
+        return None
+
+    return best
 
 
 def convert_to_wav(source_path: Path, wav_path: Path) -> bool:
 
-    try:                                                                                              
+    try:
         ext = source_path.suffix.lower()
         fmt = SUPPORTED_FORMATS.get(ext)
         if not fmt:
             logger.error(f"Unsupported format: {ext}")
             return False
 
+        settings = get_settings()
         logger.info(f"Converting {source_path.name} to WAV")
-        audio = AudioSegment.from_file(str(source_path), format=fmt)
         wav_path.parent.mkdir(parents=True, exist_ok=True)
-        audio.export(str(wav_path), format="wav")
+        subprocess.run(
+            [
+                "ffmpeg",
+                "-y",
+                "-i", str(source_path),
+                "-ac", "1",
+                "-ar", str(settings.audio.sample_rate),
+                "-vn",
+                str(wav_path),
+            ],
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+        )
         logger.info(f"Conversion complete: {wav_path}")
         return True
+    except subprocess.CalledProcessError as e:
+        stderr = e.stderr.decode(errors="replace") if e.stderr else ""
+        logger.error(f"ffmpeg failed to convert audio to WAV: {stderr.strip()}")
+        return False
     except Exception as e:
         logger.error(f"Failed to convert audio to WAV: {e}")
         return False
 
 
+def _is_canonical_wav(wav_path: Path) -> bool:
+    """True when the WAV is already mono at the configured sample rate.
+
+    Everything downstream (splitting, Whisper) assumes the canonical rate,
+    so a WAV at the source rate would be silently resampled N times later.
+    """
+    try:
+        info = sf.info(str(wav_path))
+    except Exception as e:
+        logger.warning(f"Could not inspect {wav_path.name}: {e}")
+        return False
+    return (
+        info.samplerate == get_settings().audio.sample_rate
+        and info.channels == 1
+    )
+
+
+# Positive results only. lru_cache would also memoize failures, but a miss
+# (user drops the file in and retries) must probe the filesystem again.
+_verified_wavs: set[tuple[str, str]] = set()
+
+
 def ensure_wav_audio(raw_dir: Path, audio_wav: Path) -> bool:
-    if audio_wav.exists():
-        logger.debug(f"WAV file found: {audio_wav}")
+    key = (os.fspath(raw_dir), os.fspath(audio_wav))
+    if key in _verified_wavs:
+        logger.debug("WAV already verified this run: %s", audio_wav)
+        return True
+    if _ensure_wav_audio(raw_dir, audio_wav):
+        _verified_wavs.add(key)
         return True
+    return False
+
+
+def _ensure_wav_audio(raw_dir: Path, audio_wav: Path) -> bool:
+    if audio_wav.exists():
+        if _is_canonical_wav(audio_wav):
+            logger.debug("WAV file found: %s", audio_wav)
+            return True
+        logger.info(f"Existing WAV is not canonical, reconverting: {audio_wav.name}")
 
     source = find_audio_file(raw_dir)
     if source:
         logger.info(f"Found audio file: {source.name}")
         return convert_to_wav(source, audio_wav)
 
+    if audio_wav.exists():
+        # No raw source left; normalize the existing WAV in place
+        tmp_path = audio_wav.with_suffix(".tmp.wav")
+        if convert_to_wav(audio_wav, tmp_path):
+            os.replace(tmp_path, audio_wav)
+            return True
+        return False
+
     logger.error(f"No supported audio file found in {raw_dir}")
     logger.error(f"Supported formats: {', '.join(SUPPORTED_FORMATS.keys())}")
     return False
@@ -43,14 +43,6 @@ def diarize_audio(audio_path: Path, hf_token: str | None = None, device: str = "
     if not token:
         raise ValueError("HF_TOKEN not found. Set it via environment or pass hf_token.")
 
-    logger.info(f"Loading audio: {audio_path}")
-    data, sample_rate = sf.read(str(audio_path))
-    waveform = torch.from_numpy(data).float()
-    if waveform.ndim == 1:
-        waveform = waveform.unsqueeze(0)
-    else:
-        waveform = waveform.T
-
     logger.info("Loading pyannote speaker-diarization-3.1 pipeline")
     pipeline = Pipeline.from_pretrained(
         "pyannote/speaker-diarization-3.1",
@@ -59,7 +51,19 @@ def diarize_audio(audio_path: Path, hf_token: str | None = None, device: str = "
     pipeline.to(torch.device(device))
 
     logger.info(f"Running diarization on device: {device}")
-    output = pipeline({"waveform": waveform, "sample_rate": sample_rate})
+    try:
+        # Hand pyannote the path so it streams sliding windows from disk
+        # instead of keeping the full decoded waveform in RAM
+        output = pipeline(str(audio_path))
+    except Exception as e:
+        logger.warning(f"Streaming diarization failed, decoding in memory: {e}")
+        # Decode straight to float32 (channels-last) so no int->float copy is
+        # needed and the transpose below is the only reshape
+        with sf.SoundFile(str(audio_path)) as audio_file:
+            sample_rate = audio_file.samplerate
+            data = audio_file.read(dtype="float32", always_2d=True)
+        waveform = torch.from_numpy(data.T).contiguous()
+        output = pipeline({"waveform": waveform, "sample_rate": sample_rate})
 
     annotation = output.speaker_diarization
 
@@ -1,58 +1,92 @@
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from pydub import AudioSegment
+import numpy as np
+import soundfile as sf
 
+from src.config.settings import get_settings
 from src.models.segment import Segment
 
 logger = logging.getLogger(__name__)
 
 
-def split_audio_segments(audio_path: Path,segments: list[Segment],output_dir: Path,) -> list[Path]:
+def split_audio_segments(audio_path: Path,segments: list[Segment],output_dir: Path,) -> list[tuple[Path, np.ndarray]]:
     """Split audio file into clips based on provided segments.
 
-    Args: 
+    Args:
         audio_path (Path): Path to the input audio file.
         segments (list[Segment]): List of segments with start and end times.
         output_dir (Path): Directory to save the output clips.
-    
+
     Returns:
-        list[Path]: List of paths to the generated audio clips.
-        
+        list[tuple[Path, np.ndarray]]: Path and float32 mono samples of each
+        generated clip. The arrays feed Whisper directly so transcription
+        never re-reads the clips from disk.
+
     Raises:
         None. Assumes valid input paths and segments.
-        
+
     Note:
-        - Uses pydub to handle audio splitting
-        - Exports clips in WAV format
+        - Decodes the WAV once with soundfile and writes each clip as a
+          numpy slice, so no per-clip decode or ffmpeg fork is needed
+        - With audio.parallel_chunks > 1, clip writes run concurrently
+        - Exports clips in 16-bit PCM WAV format (kept for provenance)
         -Creates output directory if it does not exist
         - Logs key steps for transparency
-        
+
     Example:
         >>> audio_path = Path("/path/to/audio.wav")
         >>> segments = [Segment(start=0.0, end=5.0), Segment(start=10.0, end= 15.0
         >>> output_fir = Path("/path/to/output_clips"))]
-        >>> clip_paths = split_audio_segments(audio_path, segments, output_dir)
-        >>> for path in clip_paths:
-        >>>     print(path)
+        >>> clips = split_audio_segments(audio_path, segments, output_dir)
+        >>> for path, samples in clips:
+        >>>     print(path, samples.shape)
         """
+    if not segments:
+        logger.info("Split complete: 0 clips")
+        return []
+
     output_dir.mkdir(parents=True, exist_ok=True)
 
     logger.info(f"Loading audio: {audio_path}")
-    audio = AudioSegment.from_wav(str(audio_path))
+    data, sample_rate = sf.read(os.fspath(audio_path), dtype="int16", always_2d=True)
+
+    n = len(segments)
+    clip_paths = [output_dir / f"part_{idx}.wav" for idx in range(n)]
+    # os.fspath once per clip beats Path.__str__ inside the export loop
+    clip_strs = list(map(os.fspath, clip_paths))
+    debug = logger.isEnabledFor(logging.DEBUG)
 
-    clip_paths = []
-    for idx, seg in enumerate(segments):
-        start_ms = int(seg.start * 1000)
-        end_ms = int(seg.end * 1000)
-        clip = audio[start_ms:end_ms]
+    # One vectorized pass turns all segment bounds into sample offsets
+    starts = np.fromiter((seg.start for seg in segments), dtype=np.float64, count=n)
+    ends = np.fromiter((seg.end for seg in segments), dtype=np.float64, count=n)
+    start_samples = (starts * sample_rate).astype(np.int64)
+    end_samples = (ends * sample_rate).astype(np.int64)
 
-        out_path = output_dir / f"part_{idx}.wav"
-        clip.export(str(out_path), format="wav")
-        clip_paths.append(out_path)
+    def export_clip(idx: int) -> np.ndarray:
+        clip = data[start_samples[idx]:end_samples[idx]]
+        sf.write(clip_strs[idx], clip, sample_rate, subtype="PCM_16")
+        if debug:
+            logger.debug(
+                "Exported: %s (%.3fs)", clip_paths[idx].name, ends[idx] - starts[idx]
+            )
+        # Whisper wants float32 mono in [-1, 1]
+        return clip.astype(np.float32).ravel() / 32768.0
 
-        duration = (end_ms - start_ms) / 1000
-        logger.debug(f"Exported: {out_path.name} ({duration:.3f}s)")
+    # Threads suffice here: soundfile releases the GIL during encode/write,
+    # and sharing `data` avoids pickling slices to worker processes
+    workers = min(
+        get_settings().audio.parallel_chunks,
+        n,
+        os.cpu_count() or 1,
+    )
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            samples = list(executor.map(export_clip, range(n)))
+    else:
+        samples = [export_clip(idx) for idx in range(n)]
 
     logger.info(f"Split complete: {len(clip_paths)} clips")
-    return clip_paths
+    return list(zip(clip_paths, samples))
@@ -28,17 +28,28 @@
 """
 
 import logging
+import os
+from bisect import bisect_right
+from functools import lru_cache
 from pathlib import Path
+from threading import Lock
+from typing import Iterator
 
+import numpy as np
 import whisper
 from langdetect import detect, LangDetectException
-from pydub import AudioSegment
 
 from src.config.settings import get_settings
 from src.models.segment import Segment, TranscribedSegment
 
 logger = logging.getLogger(__name__)
 
+_model_lock = Lock()
+
+# Clips arrive from split_audio_segments as (path, float32 samples) pairs,
+# or as bare paths when the samples were not preloaded
+_Clip = Path | tuple[Path, np.ndarray]
+
 
 def detect_language(text: str) -> str:
     try:
@@ -47,53 +58,315 @@ def detect_language(text: str) -> str:
         return "en"
 
 
-def transcribe_segments(segments: list[Segment],clip_paths: list[Path],
-model_name: str | None = None,
-    language: str | None = None,
-) -> tuple[list[TranscribedSegment], str]:
+class _FasterWhisperAdapter:
+    """Wrap faster_whisper.WhisperModel behind whisper's transcribe() dict API."""
+
+    def __init__(self, model, batch_size: int | None = None):
+        self._model = model
+        self._batch_size = batch_size
+
+    def transcribe(self, path: str, language: str | None = None,
+                   word_timestamps: bool = False) -> dict:
+        kwargs = {"language": language}
+        if word_timestamps:
+            kwargs["word_timestamps"] = True
+        if self._batch_size is not None:
+            kwargs["batch_size"] = self._batch_size
+        segments, info = self._model.transcribe(path, **kwargs)
+
+        if word_timestamps:
+            parts = []
+            out_segments = []
+            for segment in segments:
+                parts.append(segment.text)
+                out_segments.append({
+                    "words": [
+                        {"word": w.word, "start": w.start, "end": w.end}
+                        for w in (segment.words or [])
+                    ]
+                })
+            return {
+                "text": "".join(parts),
+                "language": info.language,
+                "segments": out_segments,
+            }
+
+        text = "".join(segment.text for segment in segments)
+        return {"text": text, "language": info.language}
+
+    def detect(self, path: str) -> str:
+        # The segment generator is lazy: leaving it unconsumed runs only
+        # the language probe, not the full decode
+        _, info = self._model.transcribe(path)
+        return info.language
 
+
+def _resolve_device() -> str:
+    device = get_settings().audio.device
+    if device == "auto":
+        import torch
+
+        return "cuda" if torch.cuda.is_available() else "cpu"
+    return device
+
+
+@lru_cache(maxsize=2)
+def _get_model(model_name: str, backend: str):
     settings = get_settings()
-    model_name = model_name or settings.audio.whisper_model
-    min_duration = settings.audio.min_segment_duration
+    device = _resolve_device()
+
+    if backend == "faster":
+        try:
+            from faster_whisper import WhisperModel
+
+            logger.info(f"Loading faster-whisper model: {model_name} on {device}")
+            model = WhisperModel(
+                model_name,
+                device=device,
+                compute_type=settings.audio.compute_type,
+            )
+            try:
+                # Packs VAD chunks of each clip into batched forward passes
+                from faster_whisper import BatchedInferencePipeline
+
+                return _FasterWhisperAdapter(
+                    BatchedInferencePipeline(model=model),
+                    batch_size=settings.audio.batch_size,
+                )
+            except ImportError:
+                return _FasterWhisperAdapter(model)
+        except ImportError:
+            logger.warning(
+                "faster-whisper not installed, falling back to openai-whisper"
+            )
+
+    logger.info(f"Loading Whisper model: {model_name} on {device}")
+    return whisper.load_model(model_name, device=device, in_memory=True)
+
+
+def _load_model(model_name: str):
+    # Reuse loaded weights across pipeline runs; the lock keeps concurrent
+    # callers from racing two loads of the same model
+    with _model_lock:
+        return _get_model(model_name, get_settings().audio.whisper_backend)
+
+
+def _transcribe_opts(model) -> dict:
+    """Extra kwargs for openai-whisper: explicit fp16 halves bandwidth on
+    CUDA and silences the fp16-fallback warning on CPU."""
+    if isinstance(model, _FasterWhisperAdapter):
+        return {}
+    device = getattr(model, "device", None)
+    return {"fp16": getattr(device, "type", None) == "cuda"}
+
+
+def _clip_input(clip: _Clip):
+    """Accept (path, float32 samples) pairs from the segmenter or bare paths."""
+    if isinstance(clip, tuple):
+        path, audio = clip
+        return path, audio
+    return clip, os.fspath(clip)
+
+
+def _detect_clip_language(model, audio) -> str:
+    if isinstance(model, _FasterWhisperAdapter):
+        return model.detect(audio)
+
+    # Encoder + one decoder step; much cheaper than a full transcribe
+    if isinstance(audio, str):
+        audio = whisper.load_audio(audio)
+    audio = whisper.pad_or_trim(audio)
+    mel = whisper.log_mel_spectrogram(audio, n_mels=model.dims.n_mels)
+    _, probs = model.detect_language(mel.to(model.device))
+    return max(probs, key=probs.get)
+
+
+def _resolve_language(model, segments: list[Segment], clips: list[_Clip],
+                      language: str | None, min_duration: float) -> str:
+    if language is not None and language != "auto":
+        return language
+
+    # Auto-detect language from first substantial clip; durations come from
+    # the diarization bounds, so no clip needs to be decoded here
+    for seg, clip in zip(segments, clips):
+        if seg.end - seg.start >= min_duration:
+            _, audio = _clip_input(clip)
+            detected = _detect_clip_language(model, audio)
+            logger.info(f"Detected language: {detected}")
+            return detected
+
+    return "en"
+
+
+# Silence inserted between packed clips so Whisper keeps utterances apart
+_PACK_GAP = 0.1
 
-    logger.info(f"Loading Whisper model: {model_name}")
-    model = whisper.load_model(model_name)
-
-    # Auto-detect language from first substantial clip
-    detected_lang = language
-    if detected_lang is None or detected_lang == "auto":
-        for path in clip_paths:
-            clip = AudioSegment.from_wav(str(path))
-            if len(clip) / 1000 >= min_duration:
-                result = model.transcribe(str(path))
-                detected_lang = result.get("language", "en")
-                logger.info(f"Detected language: {detected_lang}")
-                break
-        else:
-            detected_lang = "en"
 
-    transcribed = []
-    for idx, (seg, path) in enumerate(zip(segments, clip_paths)):
-        clip = AudioSegment.from_wav(str(path))
-        duration = len(clip) / 1000
+def _pack_segments(segments: list[Segment], clips: list[_Clip], min_duration: float,
+                   max_duration: float) -> list[list[int]]:
+    """Group consecutive same-speaker in-memory clips into Whisper windows.
 
-        if duration < min_duration:
-            text = ""
-            logger.debug(f"Skipped {path.name} (too short: {duration:.3f}s)")
+    Whisper pads every input to 30s, so transcribing many short utterances
+    one by one wastes most of each encoder pass. Packs never mix speakers
+    and never exceed max_duration; clips without in-memory samples (or too
+    short to transcribe) stay on their own.
+    """
+    packs: list[list[int]] = []
+    current: list[int] = []
+    current_duration = 0.0
+    current_speaker = None
+
+    for idx, (seg, clip) in enumerate(zip(segments, clips)):
+        duration = seg.end - seg.start
+        if not isinstance(clip, tuple) or duration < min_duration:
+            if current:
+                packs.append(current)
+                current = []
+            packs.append([idx])
+            current_speaker = None
+            continue
+
+        if current and (
+            seg.speaker != current_speaker
+            or current_duration + _PACK_GAP + duration > max_duration
+        ):
+            packs.append(current)
+            current = []
+
+        if not current:
+            current_duration = 0.0
+        current.append(idx)
+        current_speaker = seg.speaker
+        current_duration += duration + _PACK_GAP
+
+    if current:
+        packs.append(current)
+    return packs
+
+
+def _transcribe_pack(model, segments: list[Segment], clips: list[_Clip],
+                     pack: list[int], detected_lang: str) -> list[str]:
+    """Transcribe one pack and split the words back onto its members."""
+    sample_rate = get_settings().audio.sample_rate
+    gap = np.zeros(int(_PACK_GAP * sample_rate), dtype=np.float32)
+
+    pieces = []
+    offsets = []  # start time of each member inside the packed audio
+    cursor = 0.0
+    for idx in pack:
+        _, audio = _clip_input(clips[idx])
+        offsets.append(cursor)
+        pieces.append(audio)
+        pieces.append(gap)
+        cursor += audio.size / sample_rate + _PACK_GAP
+    packed = np.concatenate(pieces[:-1])
+
+    try:
+        result = model.transcribe(
+            packed, language=detected_lang, word_timestamps=True,
+            **_transcribe_opts(model),
+        )
+        texts = [""] * len(pack)
+        for segment in result["segments"]:
+            for word in segment["words"]:
+                midpoint = (word["start"] + word["end"]) / 2
+                texts[bisect_right(offsets, midpoint) - 1] += word["word"]
+        return [text.strip() for text in texts]
+    except Exception as e:
+        logger.warning(f"Pack transcription failed, falling back to per-clip: {e}")
+        return [
+            model.transcribe(
+                _clip_input(clips[idx])[1],
+                language=detected_lang,
+                **_transcribe_opts(model),
+            )
+            .get("text", "")
+            .strip()
+            for idx in pack
+        ]
+
+
+def _iter_transcribe(model, segments: list[Segment], clips: list[_Clip],
+                     detected_lang: str, min_duration: float,
+                     ) -> Iterator[TranscribedSegment]:
+    settings = get_settings()
+    if settings.audio.pack_segments:
+        packs = _pack_segments(
+            segments, clips, min_duration, settings.audio.max_pack_duration
+        )
+    else:
+        packs = [[idx] for idx in range(len(segments))]
+
+    for pack in packs:
+        if len(pack) == 1:
+            idx = pack[0]
+            seg = segments[idx]
+            path, audio = _clip_input(clips[idx])
+            duration = seg.end - seg.start
+
+            if duration < min_duration:
+                texts = [""]
+                logger.debug("Skipped %s (too short: %.3fs)", path.name, duration)
+            else:
+                result = model.transcribe(
+                    audio, language=detected_lang, **_transcribe_opts(model)
+                )
+                texts = [result.get("text", "").strip()]
+                logger.debug("Transcribed %s (%.3fs)", path.name, duration)
         else:
-            result = model.transcribe(str(path), language=detected_lang)
-            text = result.get("text", "").strip()
-            logger.debug(f"Transcribed {path.name} ({duration:.3f}s)")
+            texts = _transcribe_pack(model, segments, clips, pack, detected_lang)
+            logger.debug(
+                "Transcribed pack of %d clips (%.3fs)",
+                len(pack),
+                segments[pack[-1]].end - segments[pack[0]].start,
+            )
 
-        transcribed.append(
-            TranscribedSegment(
+        for idx, text in zip(pack, texts):
+            seg = segments[idx]
+            yield TranscribedSegment(
                 start=seg.start,
                 end=seg.end,
                 speaker=seg.speaker,
                 text=text,
                 language=detected_lang,
             )
-        )
+
+    logger.debug("Transcription stream exhausted after %d segments", len(segments))
+
+
+def open_transcription_stream(segments: list[Segment],clips: list[_Clip],
+model_name: str | None = None,
+    language: str | None = None,
+) -> tuple[Iterator[TranscribedSegment], str]:
+    """Load the model, resolve the language, and return a lazy segment stream.
+
+    Segments are transcribed as the iterator is consumed, so downstream
+    analysis can overlap with transcription of later clips. Each clip may be
+    a (path, float32 samples) pair from split_audio_segments — fed to Whisper
+    in memory — or a bare path, which is read from disk.
+    """
+    settings = get_settings()
+    model_name = model_name or settings.audio.whisper_model
+    min_duration = settings.audio.min_segment_duration
+
+    model = _load_model(model_name)
+
+    detected_lang = _resolve_language(model, segments, clips, language,
+                                      min_duration)
+
+    stream = _iter_transcribe(model, segments, clips, detected_lang, min_duration)
+    return stream, detected_lang
+
+
+def transcribe_segments(segments: list[Segment],clips: list[_Clip],
+model_name: str | None = None,
+    language: str | None = None,
+) -> tuple[list[TranscribedSegment], str]:
+
+    stream, detected_lang = open_transcription_stream(
+        segments, clips, model_name=model_name, language=language
+    )
+    transcribed = list(stream)
 
     logger.info(f"Transcription complete: {len(transcribed)} segments")
     return transcribed, detected_lang
@@ -1,11 +1,14 @@
 import os
+from functools import lru_cache
 from pathlib import Path
 
-try:
-    from dotenv import load_dotenv
-    load_dotenv()
-except ImportError:
-    pass
+# Skip the .env disk scan when the token is already in the environment
+if not os.environ.get("HF_TOKEN"):
+    try:
+        from dotenv import load_dotenv
+        load_dotenv()
+    except ImportError:
+        pass
 
 
 def setup_hf_token():
@@ -33,6 +36,7 @@ def setup_hf_token():
     print(" HF_TOKEN configurado")
 
 
+@lru_cache(maxsize=4)
 def setup_ffmpeg(script_dir: Path):
     """ Metod to set up FFmpeg path for audio processing.
     Args:
@@ -46,21 +50,25 @@ def setup_ffmpeg(script_dir: Path):
     
     Note:
         - FFmpeg is required for audio format conversions
-        - Assumes FFmpeg is located in 'engines/ffmpeg-<version>/bin' relative to script_dir
+        - Picks the newest 'engines/ffmpeg-*-full_build/bin' under script_dir,
+          so dated build directories keep working after an ffmpeg update
         - Updates system PATH to include FFmpeg binaries
+        - Memoized per script_dir, so restart loops skip the engines glob
         - Provides user feedback on setup status
-        """    
-        
-    ffmpeg_path = (
-        script_dir / "engines" / "ffmpeg-2026-01-05-git-2892815c45-full_build" / "bin"
-    )
-    if ffmpeg_path.exists():
-        os.environ["PATH"] = f"{os.environ['PATH']};{ffmpeg_path}"
+        """
+
+    candidates = sorted((script_dir / "engines").glob("ffmpeg-*-full_build/bin"))
+    ffmpeg_path = candidates[-1] if candidates else None
+    if ffmpeg_path is not None:
+        if str(ffmpeg_path) in os.environ["PATH"].split(os.pathsep):
+            return  # already on PATH; don't grow it on every invocation
+        os.environ["PATH"] = f"{os.environ['PATH']}{os.pathsep}{ffmpeg_path}"
         print(f"FFmpeg anadido al PATH: {ffmpeg_path}")
     else:
-        print(f" Advertencia: No se encontro FFmpeg en {ffmpeg_path}")
+        print(f" Advertencia: No se encontro FFmpeg en {script_dir / 'engines'}")
 
 
+@lru_cache(maxsize=1)
 def setup_environment(script_dir: Path):
     setup_hf_token()
     setup_ffmpeg(script_dir)
@@ -31,10 +31,11 @@
 
 
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ProjectPaths:
     script_dir: Path
     raw_dir: Path
@@ -47,15 +48,19 @@ class ProjectPaths:
     sentiment_json: Path
 
 
+@lru_cache(maxsize=4)
 def get_project_paths(script_dir: Path) -> ProjectPaths:
+    # Build the shared prefixes once instead of re-joining them per field
+    data = script_dir / "data"
+    output = data / "output"
     return ProjectPaths(
         script_dir=script_dir,
-        raw_dir=script_dir / "data" / "raw",
-        audio_wav=script_dir / "data" / "refined" / "audio.wav",
-        rttm_file=script_dir / "data" / "interim" / "audio.rttm",
-        segments_json=script_dir / "data" / "output" / "audio_diarizado.json",
-        parts_dir=script_dir / "data" / "output" / "parts",
-        transcriptions_json=script_dir / "data" / "output" / "transcriptions.json",
-        final_json=script_dir / "data" / "output" / "audio_diarizado_transcribed.json",
-        sentiment_json=script_dir / "data" / "output" / "sentiment_analysis.json",
+        raw_dir=data / "raw",
+        audio_wav=data / "refined" / "audio.wav",
+        rttm_file=data / "interim" / "audio.rttm",
+        segments_json=output / "audio_diarizado.json",
+        parts_dir=output / "parts",
+        transcriptions_json=output / "transcriptions.json",
+        final_json=output / "audio_diarizado_transcribed.json",
+        sentiment_json=output / "sentiment_analysis.json",
     )
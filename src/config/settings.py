@@ -26,40 +26,62 @@ Example:
 
 import logging
 from pathlib import Path
-from functools import lru_cache
+from functools import cache
 
 import yaml
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from rich.logging import RichHandler
 
 from src.utils.progress import console
 
 
-class AudioSettings(BaseModel):
+class FrozenModel(BaseModel):
+    """Immutable base for settings: safe to cache and share across threads."""
+
+    model_config = ConfigDict(frozen=True)
+
+
+class AudioSettings(FrozenModel):
     whisper_model: str = "small"
+    whisper_backend: str = "faster"  # "faster" (CTranslate2 INT8) or "openai"
+    batch_size: int = Field(default=16, ge=1)  # faster-whisper batched decode
+    compute_type: str = "int8"  # CTranslate2 dtype; "int8_float16" on GPU
+    device: str = "auto"  # "auto" picks cuda when available, else cpu
     sample_rate: int = 16000
     min_segment_duration: float = 0.1
+    # Concurrent soundfile writer threads when exporting clips; 1 = serial
+    parallel_chunks: int = Field(default=4, ge=1)
+    # Pack consecutive same-speaker clips into one Whisper window
+    pack_segments: bool = True
+    max_pack_duration: float = Field(default=28.0, gt=0)
 
 
-class AnalysisSettings(BaseModel):
-    question_model: str = "facebook/bart-large-mnli"
+class AnalysisSettings(FrozenModel):
+    question_model_binary: str = "shahrukhx01/question-vs-statement-classifier"
     default_language: str = "auto"
+    qc_batch_size: int = Field(default=16, ge=1)
+    analyzer_batch_size: int = Field(default=32, ge=1)
+    quantize: bool = True
+    use_onnx: bool = True
+    # Compile analysis models with Inductor; first batch pays compile time
+    torch_compile: bool = False
+    cache_results: bool = True
 
 
-class ThresholdSettings(BaseModel):
+class ThresholdSettings(FrozenModel):
     question_confidence: float = Field(default=0.5, ge=0, le=1)
 
 
-class OutputSettings(BaseModel):
+class OutputSettings(FrozenModel):
     format: str = "json"
     include_probabilities: bool = True
 
 
-class LoggingSettings(BaseModel):
+class LoggingSettings(FrozenModel):
     level: str = "INFO"
 
 
-class Settings(BaseModel):
+class Settings(FrozenModel):
     audio: AudioSettings = AudioSettings()
     analysis: AnalysisSettings = AnalysisSettings()
     thresholds: ThresholdSettings = ThresholdSettings()
@@ -67,7 +89,7 @@ class Settings(BaseModel):
     logging: LoggingSettings = LoggingSettings()
 
 
-@lru_cache
+@cache
 def get_settings() -> Settings:
     config_path = Path(__file__).parent.parent.parent / "config.yaml"
 
@@ -80,6 +102,10 @@ def get_settings() -> Settings:
 
 
 def setup_logging(settings: Settings | None = None) -> logging.Logger:
+    # basicConfig would otherwise stack a second RichHandler on re-entry
+    if logging.getLogger().handlers:
+        return logging.getLogger("interview_analyzer")
+
     if settings is None:
         settings = get_settings()
 
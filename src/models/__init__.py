@@ -1,9 +1,17 @@
 from src.models.segment import Segment, TranscribedSegment
-from src.models.analysis import SentimentResult, EmotionResult, AnalyzedSegment
+from src.models.analysis import (
+    Role,
+    SpeakerRole,
+    SentimentResult,
+    EmotionResult,
+    AnalyzedSegment,
+)
 from src.models.interview import InterviewMetadata, InterviewReport, InterviewAnalysis
 
 __all__ = [
     "Segment",
+    "Role",
+    "SpeakerRole",
     "TranscribedSegment",
     "SentimentResult",
     "EmotionResult",
@@ -1,5 +1,7 @@
+from dataclasses import dataclass
+from enum import Enum
+
 from pydantic import BaseModel, Field
-from src.models.segment import TranscribedSegment
 
 
 """ Data models for analyzed segments in the interview analysis pipeline.
@@ -40,22 +42,55 @@ Example:
         print
     """
 
-class SentimentResult(BaseModel):
+class Role(str, Enum):
+    """Segment roles as singleton str members: hot loops can compare by
+    identity while JSON output keeps the plain string values."""
+
+    QUESTION = "question"
+    STATEMENT = "statement"
+
+
+class SpeakerRole(str, Enum):
+    INTERVIEWER = "Interviewer"
+    INTERVIEWEE = "Interviewee"
+
+
+# Frozen slot dataclasses: built per segment in hot loops, so they skip
+# pydantic validation machinery; a __post_init__ guard keeps scores in [0, 1]
+@dataclass(frozen=True, slots=True)
+class SentimentResult:
     label: str  # POS, NEG, NEU
-    score: float = Field(ge=0, le=1)
+    score: float
     probabilities: dict[str, float]
 
+    def __post_init__(self):
+        if not 0 <= self.score <= 1:
+            raise ValueError("score must be between 0 and 1")
 
-class EmotionResult(BaseModel):
+
+@dataclass(frozen=True, slots=True)
+class EmotionResult:
     label: str  # joy, anger, sadness, fear, disgust, surprise, others
-    score: float = Field(ge=0, le=1)
+    score: float
     probabilities: dict[str, float]
 
+    def __post_init__(self):
+        if not 0 <= self.score <= 1:
+            raise ValueError("score must be between 0 and 1")
+
 
-class AnalyzedSegment(TranscribedSegment):
+class AnalyzedSegment(BaseModel):
+    # Pydantic stays at the JSON report boundary; the transcription fields
+    # are redeclared here now that TranscribedSegment is a plain dataclass
+    start: float
+    end: float
+    speaker: str
+    text: str
+    language: str = "unknown"
     segment_id: int
-    role: str  # question, statement
-    speaker_role: str  # Interviewer, Interviewee
+    role: Role  # question, statement
+    # Interviewer/Interviewee coerce to SpeakerRole; raw speaker names stay str
+    speaker_role: SpeakerRole | str = Field(union_mode="left_to_right")
     sentiment: SentimentResult | None = None
     emotion: EmotionResult | None = None
     paired_with: int | None = None
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from dataclasses import dataclass
 
 """ Data models for basic segment structures in the interview analysis pipeline.
 These models define the foundational attributes of segments, including timing,
@@ -15,11 +15,13 @@ Returns:
 
 Raises:
     None. Assumes valid input data for segment creation.
-    
+
 Note:
-    - Uses pydantic for data validation and default values
+    - Plain frozen dataclasses with slots: these are built once per segment in
+      hot loops, so they skip pydantic validation and per-instance dicts
+    - A cheap __post_init__ guard keeps negative timestamps out
     - Facilitates easy extension for additional segment attributes
-    
+
 Example:
     >>> segment = Segment(start=0.0, end=5.0, speaker="Speaker 1")
     >>> transcribed_segment = TranscribedSegment(
@@ -27,17 +29,23 @@ Example:
             end=5.0,
             speaker="Speaker 1",
             text="Hello, how are you?",
-            language="en") 
+            language="en")
     >>> print(segment)
     >>> print(transcribed_segment)
-    
+
         """
-class Segment(BaseModel):
-    start: float = Field(ge=0)
-    end: float = Field(ge=0)
+@dataclass(frozen=True, slots=True)
+class Segment:
+    start: float
+    end: float
     speaker: str
 
+    def __post_init__(self):
+        if self.start < 0 or self.end < 0:
+            raise ValueError("segment times must be non-negative")
+
 
+@dataclass(frozen=True, slots=True)
 class TranscribedSegment(Segment):
     text: str
     language: str = "unknown"
@@ -25,11 +25,10 @@
 """
 
 
-import json
 import logging
 from collections import Counter
-from datetime import datetime
 from pathlib import Path
+from time import strftime
 
 from src.models.analysis import AnalyzedSegment
 from src.models.interview import (
@@ -44,12 +43,19 @@ logger = logging.getLogger(__name__)
 
 
 def _calculate_distribution(
-    items: list[str], total: int
+    counts: Counter, total: int
 ) -> dict[str, SentimentDistribution]:
-    counts = Counter(items)
+    if total <= 0:
+        return {
+            label: SentimentDistribution(count=count, percentage=0.0)
+            for label, count in counts.items()
+        }
+
+    # total is invariant: one division up front, one multiply per label
+    scale = 100.0 / total
     return {
         label: SentimentDistribution(
-            count=count, percentage=round(100 * count / total, 1) if total > 0 else 0.0
+            count=count, percentage=round(count * scale, 1)
         )
         for label, count in counts.items()
     }
@@ -62,41 +68,54 @@ def generate_report(
     interview_id: str = "interview_001",
 ) -> InterviewAnalysis:
 
-    participants = list(set(seg.speaker_role for seg in segments))
-    questions = [s for s in segments if s.role == "question"]
-    statements = [s for s in segments if s.role == "statement"]
-
-    # Sentiment stats (only for statements/answers)
-    sentiments = [s.sentiment.label for s in statements if s.sentiment]
-    sentiment_dist = _calculate_distribution(sentiments, len(statements))
-
-    # Emotion stats
-    emotions = [s.emotion.label for s in statements if s.emotion]
-    emotion_dist = _calculate_distribution(emotions, len(statements))
-
-    # Average sentiment score
-    scores = [s.sentiment.score for s in statements if s.sentiment]
-    avg_score = round(sum(scores) / len(scores), 3) if scores else 0.5
-
-    # Dominant labels
-    dominant_sentiment = max(
-        sentiment_dist, key=lambda k: sentiment_dist[k].count, default="N/A"
+    # One pass accumulates every report statistic instead of rebuilding
+    # filtered lists of the segments five times over
+    # dict keys dedup like a set but keep first-seen order, so the
+    # participants list (and the report JSON) is stable across runs
+    participants: dict = {}
+    sentiment_counts: Counter = Counter()
+    emotion_counts: Counter = Counter()
+    n_questions = n_statements = 0
+    score_sum = 0.0
+    score_n = 0
+
+    for seg in segments:
+        participants[seg.speaker_role] = None
+        if seg.role == "question":
+            n_questions += 1
+        elif seg.role == "statement":
+            n_statements += 1
+            # Sentiment/emotion stats only cover statements/answers
+            if seg.sentiment:
+                sentiment_counts[seg.sentiment.label] += 1
+                score_sum += seg.sentiment.score
+                score_n += 1
+            if seg.emotion:
+                emotion_counts[seg.emotion.label] += 1
+
+    sentiment_dist = _calculate_distribution(sentiment_counts, n_statements)
+    emotion_dist = _calculate_distribution(emotion_counts, n_statements)
+    avg_score = round(score_sum / score_n, 3) if score_n else 0.5
+
+    # Dominant labels, straight off the Counters (C-level nlargest)
+    dominant_sentiment = (
+        sentiment_counts.most_common(1)[0][0] if sentiment_counts else "N/A"
     )
-    dominant_emotion = max(
-        emotion_dist, key=lambda k: emotion_dist[k].count, default="N/A"
+    dominant_emotion = (
+        emotion_counts.most_common(1)[0][0] if emotion_counts else "N/A"
     )
 
     metadata = InterviewMetadata(
-        date=datetime.now().strftime("%Y-%m-%d"),
-        participants=participants,
+        date=strftime("%Y-%m-%d"),
+        participants=list(participants),
         duration_seconds=round(duration_seconds, 2),
         language=language,
     )
 
     report = InterviewReport(
         total_segments=len(segments),
-        total_questions=len(questions),
-        total_statements=len(statements),
+        total_questions=n_questions,
+        total_statements=n_statements,
         sentiment_distribution=sentiment_dist,
         emotion_distribution=emotion_dist,
         average_sentiment_score=avg_score,
@@ -115,7 +134,8 @@ def generate_report(
 def save_analysis(analysis: InterviewAnalysis, output_path: Path) -> None:
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(analysis.model_dump(), f, ensure_ascii=False, indent=2)
+    # model_dump_json serializes straight from pydantic-core (Rust),
+    # skipping the intermediate model_dump() dict entirely
+    output_path.write_text(analysis.model_dump_json(indent=2), encoding="utf-8")
 
     logger.info(f"Analysis saved to: {output_path}")
@@ -26,14 +26,15 @@
 """
 
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from src.audio.converter import ensure_wav_audio
 from src.audio.diarizer import diarize_audio
 from src.audio.segmenter import split_audio_segments
-from src.audio.transcriber import transcribe_segments
-from src.analysis.sentiment import analyze_text
-from src.analysis.question_classifier import classify_question
+from src.audio.transcriber import open_transcription_stream
+from src.analysis.sentiment import analyze_text_batch, warmup
+from src.analysis.question_classifier import classify_questions
 from src.analysis.speaker_mapper import map_speakers
 from src.analysis.qa_pairer import pair_questions_answers
 from src.config.settings import get_settings
@@ -42,6 +43,31 @@ from src.models.interview import InterviewAnalysis
 from src.output.report_generator import generate_report, save_analysis
 from src.utils.progress import pipeline_progress
 
+
+# Languages pysentimiento ships analyzers for; anything else analyzes as "en"
+_SUPPORTED_LANGS = frozenset(("es", "en", "it", "pt"))
+
+
+# Neutral sentiment/emotion attached to questions, which are not analyzed.
+# The results are frozen, so every question shares these two instances
+_QUESTION_SENTIMENT = SentimentResult(
+    label="NEU",
+    score=0.95,
+    probabilities={"NEG": 0.025, "NEU": 0.95, "POS": 0.025},
+)
+_QUESTION_EMOTION = EmotionResult(
+    label="others",
+    score=0.95,
+    probabilities={
+        "others": 0.95,
+        "joy": 0.008,
+        "sadness": 0.008,
+        "anger": 0.008,
+        "surprise": 0.008,
+        "disgust": 0.008,
+        "fear": 0.008,},)
+
+
 def run_pipeline(
     raw_dir: Path,
     audio_wav: Path,
@@ -67,61 +93,92 @@ def run_pipeline(
 
         # Step 3: Split audio
         progress.start_phase("Audio Segmentation", total=len(segments))
-        clip_paths = split_audio_segments(audio_wav, segments, parts_dir)
+        clips = split_audio_segments(audio_wav, segments, parts_dir)
         progress.complete_phase("Audio Segmentation")
 
-        # Step 4: Transcribe
+        # Step 4: Transcribe, overlapped with Step 5 via a worker pool:
+        # while Whisper decodes clip N, a worker classifies batches of the
+        # already-transcribed clips
         progress.start_phase("Transcription", total=len(segments))
-        transcribed, detected_lang = transcribe_segments(
+        stream, detected_lang = open_transcription_stream(
             segments,
-            clip_paths,
+            clips,
             language=settings.analysis.default_language,)
-        progress.complete_phase("Transcription")
 
-        lang = detected_lang if detected_lang in ["es", "en", "it", "pt"] else "en"
+        lang = detected_lang if detected_lang in _SUPPORTED_LANGS else "en"
 
         # Step 5: Classify questions
-        progress.start_phase("Question Classification", total=len(transcribed))
+        progress.start_phase("Question Classification", total=len(segments))
         # Step 6: Sentiment analysis
-        progress.start_phase("Sentiment Analysis", total=len(transcribed))
-        # Step 7: Speaker mapping
+        progress.start_phase("Sentiment Analysis", total=len(segments))
+
+        transcribed = []
+        pending: list[tuple[int, str]] = []  # (segment index, text)
+        chunk_futures: list[tuple[list[int], object]] = []
+        qc_batch = settings.analysis.qc_batch_size
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            # Preload the analysis models while Whisper decodes the first clips
+            executor.submit(warmup, lang)
+
+            def flush_pending():
+                if pending:
+                    indices = [idx for idx, _ in pending]
+                    texts = [text for _, text in pending]
+                    chunk_futures.append(
+                        (indices, executor.submit(classify_questions, texts))
+                    )
+                    pending.clear()
+
+            for seg in stream:
+                transcribed.append(seg)
+                if seg.text.strip():
+                    pending.append((len(transcribed) - 1, seg.text))
+                    if len(pending) >= qc_batch:
+                        flush_pending()
+                progress.advance("Transcription")
+            flush_pending()
+
+            # Speaker mapping only needs `transcribed`, so it can overlap
+            # with the remaining classification batches
+            map_future = executor.submit(map_speakers, transcribed)
+
+            # Empty segments never reach the classifier and stay statements
+            roles: list[str] = ["statement"] * len(transcribed)
+            for indices, future in chunk_futures:
+                for idx, (role, _) in zip(indices, future.result()):
+                    roles[idx] = role
+                    progress.advance("Question Classification")
+        progress.complete_phase("Transcription")
+        progress.complete_phase("Question Classification")
+
+        # Step 6: batch sentiment/emotion across all statement texts at once
+        statement_idx = [
+            idx for idx, seg in enumerate(transcribed)
+            if roles[idx] == "statement" and seg.text.strip()
+        ]
+        statement_results = analyze_text_batch(
+            [transcribed[idx].text for idx in statement_idx], lang
+        )
+        results_by_idx = dict(zip(statement_idx, statement_results))
+        progress.complete_phase("Sentiment Analysis")
+
+        # Step 7: Speaker mapping (computed concurrently above)
         progress.start_phase("Speaker Mapping")
-        speaker_map = map_speakers(transcribed)
+        speaker_map = map_future.result()
         progress.complete_phase("Speaker Mapping")
 
         analyzed_segments: list[AnalyzedSegment] = []
         for idx, seg in enumerate(transcribed):
-            if not seg.text.strip():
-                role = "statement"
-            else:
-                role, _ = classify_question(seg.text)
-            progress.advance("Question Classification")
-
+            role = roles[idx]
             speaker_role = speaker_map.get(seg.speaker, seg.speaker)
 
-            if not seg.text.strip():
-                sentiment = None
-                emotion = None
-            elif role == "statement":
-                sentiment, emotion = analyze_text(seg.text, lang)
+            if idx in results_by_idx:
+                sentiment, emotion = results_by_idx[idx]
+            elif not seg.text.strip():
+                sentiment, emotion = None, None
             else:
-                sentiment = SentimentResult(
-                    label="NEU",
-                    score=0.95,
-                    probabilities={"NEG": 0.025, "NEU": 0.95, "POS": 0.025},
-                )
-                emotion = EmotionResult(
-                    label="others",
-                    score=0.95,
-                    probabilities={
-                        "others": 0.95,
-                        "joy": 0.008,
-                        "sadness": 0.008,
-                        "anger": 0.008,
-                        "surprise": 0.008,
-                        "disgust": 0.008,
-                        "fear": 0.008,},)
-            progress.advance("Sentiment Analysis")
+                sentiment, emotion = _QUESTION_SENTIMENT, _QUESTION_EMOTION
 
             analyzed_segments.append(
                 AnalyzedSegment(
@@ -137,9 +194,6 @@ def run_pipeline(
                     emotion=emotion,
                     paired_with=None,))
 
-        progress.complete_phase("Question Classification")
-        progress.complete_phase("Sentiment Analysis")
-
         # Step 8: Pair Q&A
         progress.start_phase("Q&A Pairing")
         analyzed_segments = pair_questions_answers(analyzed_segments)
@@ -155,7 +209,11 @@ def run_pipeline(
             language=detected_lang,
             interview_id=interview_id,
         )
-        save_analysis(analysis, output_path)
-        progress.complete_phase("Report Generation")
+        # Serialize and write off-thread so the disk flush overlaps the
+        # progress teardown; result() surfaces any write error before return
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            save_future = executor.submit(save_analysis, analysis, output_path)
+            progress.complete_phase("Report Generation")
+        save_future.result()
 
     return analysis
@@ -0,0 +1,44 @@
+"""Fast JSON read/write helpers shared by the output and cache modules.
+
+Args:
+    obj: JSON-serializable object (plain dicts/lists from model_dump/asdict)
+    path (Path): file to read from or write to
+    indent (bool): pretty-print with 2-space indent (report files)
+
+Returns:
+    dump_json writes bytes to disk; load_json returns the parsed object.
+
+Raises:
+    None beyond the underlying I/O errors; callers handle those.
+
+Note:
+    - Uses orjson (SIMD-accelerated, writes bytes directly) when installed,
+      falling back to the stdlib json module otherwise
+    - orjson always emits UTF-8 without escaping, matching ensure_ascii=False
+"""
+
+import json
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dump_json(obj, path: Path, indent: bool = False) -> None:
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        path.write_bytes(orjson.dumps(obj, option=option))
+        return
+
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(obj, f, ensure_ascii=False, indent=2 if indent else None)
+
+
+def load_json(path: Path):
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
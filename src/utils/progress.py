@@ -35,7 +35,9 @@ from rich.progress import (
     TimeElapsedColumn,
 )
 
-console = Console()
+# highlight=False skips the regex-based auto-highlighter that would
+# otherwise scan every status/print string on each render
+console = Console(highlight=False)
 
 PIPELINE_PHASES = [
     ("Audio Conversion", None),
@@ -61,10 +63,16 @@ class PipelineProgress:
             TimeElapsedColumn(),
             console=console,
             expand=False,
+            refresh_per_second=10,
         )
         self.tasks: dict[str, int] = {}
+        self._pending: dict[str, int] = {}
         self._started = False
 
+    # Per-segment advances are buffered and flushed in batches so rich's
+    # task-graph update doesn't run once per transcript segment
+    _FLUSH_EVERY = 16
+
     def __enter__(self):
         self.start()
         return self
@@ -92,11 +100,16 @@ class PipelineProgress:
     def advance(self, name: str, advance: int = 1):
         if name not in self.tasks:
             return
-        self.progress.advance(self.tasks[name], advance)
+        pending = self._pending.get(name, 0) + advance
+        if pending >= self._FLUSH_EVERY:
+            self.progress.advance(self.tasks[name], pending)
+            pending = 0
+        self._pending[name] = pending
 
     def complete_phase(self, name: str):
         if name not in self.tasks:
             return
+        self._pending.pop(name, None)
         task_id = self.tasks[name]
         task = self.progress.tasks[task_id]
         if task.total is None:
@@ -1,33 +1,65 @@
 """Behavioral tests for analysis modules."""
 
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 
+import pytest
+
 from src.models.segment import TranscribedSegment
 from src.models.analysis import SentimentResult, EmotionResult, AnalyzedSegment
+from src.analysis.sentiment import analyze_sentiment, analyze_emotion, analyze_text
+from src.analysis.question_classifier import classify_question, is_question
+from src.analysis.speaker_mapper import map_speakers, get_speaker_role
+from src.analysis.qa_pairer import pair_questions_answers
+
+
+@pytest.fixture(autouse=True)
+def sentiment_settings(mocker):
+    """Pin sentiment settings with the disk result cache off.
+
+    Autouse: the predict call-count assertions below must hold regardless
+    of what any earlier run (or test) left in the cache.
+    """
+    mocker.patch(
+        "src.analysis.sentiment.get_settings",
+        return_value=MagicMock(
+            analysis=MagicMock(
+                quantize=False,
+                torch_compile=False,
+                cache_results=False,
+                analyzer_batch_size=32,
+            ),
+        ),
+    )
+
+
+@pytest.fixture
+def classifier_settings(mocker):
+    """Classifier settings with every optional model transform disabled."""
+    mocker.patch(
+        "src.analysis.question_classifier.get_settings",
+        return_value=MagicMock(
+            analysis=MagicMock(
+                question_model_binary="test-model",
+                use_onnx=False,
+                quantize=False,
+                torch_compile=False,
+                cache_results=False,
+            ),
+            thresholds=MagicMock(question_confidence=0.5),
+        ),
+    )
 
 
 class TestSentimentAnalysis:
     """Tests for sentiment analysis functions."""
 
-    def test_analyze_sentiment_returns_result(self, mocker):
+    def test_analyze_sentiment_returns_result(self, shared_analyzer):
         """Test that analyze_sentiment returns a SentimentResult."""
-        mock_result = MagicMock()
-        mock_result.output = "POS"
-        mock_result.probas = {"POS": 0.8, "NEG": 0.1, "NEU": 0.1}
-
-        mock_analyzer = MagicMock()
-        mock_analyzer.predict.return_value = mock_result
-
-        mocker.patch(
-            "src.analysis.sentiment.create_analyzer",
-            return_value=mock_analyzer,
+        mock_result = SimpleNamespace(
+            output="POS", probas={"POS": 0.8, "NEG": 0.1, "NEU": 0.1}
         )
-        mocker.patch("src.analysis.sentiment._get_analyzer.cache_clear")
-
-        from src.analysis.sentiment import _get_analyzer
-        _get_analyzer.cache_clear()
-
-        from src.analysis.sentiment import analyze_sentiment
+        shared_analyzer.predict.return_value = mock_result
 
         result = analyze_sentiment("I love this!", lang="en")
 
@@ -36,24 +68,12 @@ class TestSentimentAnalysis:
         assert result.score == 0.8
         assert "POS" in result.probabilities
 
-    def test_analyze_emotion_returns_result(self, mocker):
+    def test_analyze_emotion_returns_result(self, shared_analyzer):
         """Test that analyze_emotion returns an EmotionResult."""
-        mock_result = MagicMock()
-        mock_result.output = "joy"
-        mock_result.probas = {"joy": 0.7, "sadness": 0.1, "anger": 0.2}
-
-        mock_analyzer = MagicMock()
-        mock_analyzer.predict.return_value = mock_result
-
-        mocker.patch(
-            "src.analysis.sentiment.create_analyzer",
-            return_value=mock_analyzer,
+        mock_result = SimpleNamespace(
+            output="joy", probas={"joy": 0.7, "sadness": 0.1, "anger": 0.2}
         )
-
-        from src.analysis.sentiment import _get_analyzer
-        _get_analyzer.cache_clear()
-
-        from src.analysis.sentiment import analyze_emotion
+        shared_analyzer.predict.return_value = mock_result
 
         result = analyze_emotion("I'm so happy!", lang="en")
 
@@ -61,24 +81,30 @@ class TestSentimentAnalysis:
         assert result.label == "joy"
         assert result.score == 0.7
 
-    def test_analyze_text_returns_both(self, mocker):
-        """Test that analyze_text returns both sentiment and emotion."""
-        mock_result = MagicMock()
-        mock_result.output = "POS"
-        mock_result.probas = {"POS": 0.8, "NEG": 0.1, "NEU": 0.1}
+    def test_analyze_sentiment_batch_predicts_once(self, shared_analyzer):
+        """A batch of texts reaches the analyzer as a single predict call."""
+        mock_result = SimpleNamespace(
+            output="NEU", probas={"POS": 0.2, "NEG": 0.2, "NEU": 0.6}
+        )
+        shared_analyzer.predict.reset_mock()
+        shared_analyzer.predict.return_value = [mock_result] * 3
 
-        mock_analyzer = MagicMock()
-        mock_analyzer.predict.return_value = mock_result
+        from src.analysis.sentiment import analyze_sentiment_batch
 
-        mocker.patch(
-            "src.analysis.sentiment.create_analyzer",
-            return_value=mock_analyzer,
+        results = analyze_sentiment_batch(
+            ["first answer", "second reply", "third comment"], lang="en"
         )
 
-        from src.analysis.sentiment import _get_analyzer
-        _get_analyzer.cache_clear()
+        assert shared_analyzer.predict.call_count == 1
+        assert len(results) == 3
+        assert all(isinstance(r, SentimentResult) for r in results)
 
-        from src.analysis.sentiment import analyze_text
+    def test_analyze_text_returns_both(self, shared_analyzer):
+        """Test that analyze_text returns both sentiment and emotion."""
+        mock_result = SimpleNamespace(
+            output="POS", probas={"POS": 0.8, "NEG": 0.1, "NEU": 0.1}
+        )
+        shared_analyzer.predict.return_value = mock_result
 
         sentiment, emotion = analyze_text("Great day!", lang="en")
 
@@ -89,120 +115,56 @@ class TestSentimentAnalysis:
 class TestQuestionClassifier:
     """Tests for question classification."""
 
-    def test_classify_question_identifies_question(self, mocker):
-        """Test that questions are correctly classified."""
-        mock_classifier = MagicMock()
-        mock_classifier.return_value = {
-            "labels": ["question", "statement"],
-            "scores": [0.9, 0.1],
-        }
-
-        mocker.patch(
-            "src.analysis.question_classifier.pipeline",
-            return_value=mock_classifier,
-        )
-        mocker.patch(
-            "src.analysis.question_classifier.get_settings",
-            return_value=MagicMock(
-                analysis=MagicMock(question_model="test-model"),
-                thresholds=MagicMock(question_confidence=0.5),
+    @pytest.mark.parametrize(
+        ("scores", "text", "expected_role", "expected_score"),
+        [
+            pytest.param(
+                [{"label": "LABEL_1", "score": 0.9},
+                 {"label": "LABEL_0", "score": 0.1}],
+                "How are you", "question", 0.9,
+                id="question",
             ),
-        )
-
-        from src.analysis.question_classifier import _get_classifier
-        _get_classifier.cache_clear()
-
-        from src.analysis.question_classifier import classify_question
-
-        role, score = classify_question("How are you?")
-
-        assert role == "question"
-        assert score == 0.9
-
-    def test_classify_question_identifies_statement(self, mocker):
-        """Test that statements are correctly classified."""
-        mock_classifier = MagicMock()
-        mock_classifier.return_value = {
-            "labels": ["statement", "question"],
-            "scores": [0.85, 0.15],
-        }
-
-        mocker.patch(
-            "src.analysis.question_classifier.pipeline",
-            return_value=mock_classifier,
-        )
-        mocker.patch(
-            "src.analysis.question_classifier.get_settings",
-            return_value=MagicMock(
-                analysis=MagicMock(question_model="test-model"),
-                thresholds=MagicMock(question_confidence=0.5),
+            pytest.param(
+                [{"label": "LABEL_0", "score": 0.85},
+                 {"label": "LABEL_1", "score": 0.15}],
+                "I am fine.", "statement", 0.85,
+                id="statement",
             ),
-        )
-
-        from src.analysis.question_classifier import _get_classifier
-        _get_classifier.cache_clear()
-
-        from src.analysis.question_classifier import classify_question
-
-        role, score = classify_question("I am fine.")
-
-        assert role == "statement"
-        assert score == 0.85
-
-    def test_classify_question_below_threshold_is_statement(self, mocker):
-        """Test that low-confidence questions are classified as statements."""
-        mock_classifier = MagicMock()
-        mock_classifier.return_value = {
-            "labels": ["question", "statement"],
-            "scores": [0.4, 0.6],  # Below 0.5 threshold
-        }
-
-        mocker.patch(
-            "src.analysis.question_classifier.pipeline",
-            return_value=mock_classifier,
-        )
-        mocker.patch(
-            "src.analysis.question_classifier.get_settings",
-            return_value=MagicMock(
-                analysis=MagicMock(question_model="test-model"),
-                thresholds=MagicMock(question_confidence=0.5),
+            pytest.param(
+                [{"label": "LABEL_1", "score": 0.4},  # Below 0.5 threshold
+                 {"label": "LABEL_0", "score": 0.6}],
+                "Maybe this is a question", "statement", 0.6,
+                id="below-threshold",
             ),
-        )
-
-        from src.analysis.question_classifier import _get_classifier
-        _get_classifier.cache_clear()
-
-        from src.analysis.question_classifier import classify_question
+        ],
+    )
+    def test_classify_question(self, shared_classifier, classifier_settings,
+                               scores, text, expected_role, expected_score):
+        """Roles and scores follow the ranked model output and threshold."""
+        shared_classifier.return_value = scores
 
-        role, score = classify_question("Maybe this is a question")
+        role, score = classify_question(text)
 
-        assert role == "statement"
+        assert role == expected_role
+        assert score == expected_score
 
-    def test_is_question_returns_boolean(self, mocker):
-        """Test is_question helper function."""
-        mock_classifier = MagicMock()
-        mock_classifier.return_value = {
-            "labels": ["question", "statement"],
-            "scores": [0.9, 0.1],
-        }
-
-        mocker.patch(
-            "src.analysis.question_classifier.pipeline",
-            return_value=mock_classifier,
-        )
-        mocker.patch(
-            "src.analysis.question_classifier.get_settings",
-            return_value=MagicMock(
-                analysis=MagicMock(question_model="test-model"),
-                thresholds=MagicMock(question_confidence=0.5),
-            ),
-        )
+    def test_classify_question_heuristic_short_circuits(self, shared_classifier):
+        """Obvious questions skip the model entirely."""
+        shared_classifier.reset_mock()
 
-        from src.analysis.question_classifier import _get_classifier
-        _get_classifier.cache_clear()
+        role, score = classify_question("¿Cómo te llamas?")
 
-        from src.analysis.question_classifier import is_question
+        assert role == "question"
+        assert score == 1.0
+        shared_classifier.assert_not_called()
 
+    def test_is_question_returns_boolean(self, shared_classifier,
+                                          classifier_settings):
+        """Test is_question helper function."""
+        shared_classifier.return_value = [
+            {"label": "LABEL_1", "score": 0.9},
+            {"label": "LABEL_0", "score": 0.1},
+        ]
         assert is_question("What is your name?") is True
 
 
@@ -226,8 +188,6 @@ class TestSpeakerMapper:
             ),
         ]
 
-        from src.analysis.speaker_mapper import map_speakers
-
         result = map_speakers(segments)
 
         assert result["A"] == "Interviewer"  # 1 segment
@@ -235,8 +195,6 @@ class TestSpeakerMapper:
 
     def test_map_speakers_empty_list(self):
         """Test that empty input returns empty dict."""
-        from src.analysis.speaker_mapper import map_speakers
-
         result = map_speakers([])
 
         assert result == {}
@@ -252,16 +210,28 @@ class TestSpeakerMapper:
             ),
         ]
 
-        from src.analysis.speaker_mapper import map_speakers
-
         result = map_speakers(segments)
 
         assert result["A"] == "Interviewer"
 
+    def test_map_speakers_large_interview(self):
+        """Counting stays correct on transcript-scale segment lists."""
+        segments = [
+            TranscribedSegment(
+                start=i, end=i + 1,
+                speaker="A" if i % 10 == 0 else "B",
+                text="...", language="en",
+            )
+            for i in range(10_000)
+        ]
+
+        result = map_speakers(segments)
+
+        assert result["A"] == "Interviewer"  # 1,000 segments
+        assert result["B"] == "Interviewee"  # 9,000 segments
+
     def test_get_speaker_role_returns_mapped_role(self):
         """Test get_speaker_role with valid mapping."""
-        from src.analysis.speaker_mapper import get_speaker_role
-
         speaker_map = {"SPEAKER_00": "Interviewer", "SPEAKER_01": "Interviewee"}
 
         assert get_speaker_role("SPEAKER_00", speaker_map) == "Interviewer"
@@ -269,8 +239,6 @@ class TestSpeakerMapper:
 
     def test_get_speaker_role_returns_original_if_not_mapped(self):
         """Test get_speaker_role falls back to original speaker code."""
-        from src.analysis.speaker_mapper import get_speaker_role
-
         result = get_speaker_role("UNKNOWN", {})
 
         assert result == "UNKNOWN"
@@ -292,8 +260,6 @@ class TestQAPairer:
             ),
         ]
 
-        from src.analysis.qa_pairer import pair_questions_answers
-
         result = pair_questions_answers(segments)
 
         assert result[0].paired_with == 1
@@ -316,8 +282,6 @@ class TestQAPairer:
             ),
         ]
 
-        from src.analysis.qa_pairer import pair_questions_answers
-
         result = pair_questions_answers(segments)
 
         assert result[0].paired_with is None  # No Interviewee answers before next Interviewer
@@ -326,8 +290,6 @@ class TestQAPairer:
 
     def test_pair_questions_answers_empty_list(self):
         """Test that empty list returns empty list."""
-        from src.analysis.qa_pairer import pair_questions_answers
-
         result = pair_questions_answers([])
 
         assert result == []
@@ -349,8 +311,6 @@ class TestQAPairer:
             ),
         ]
 
-        from src.analysis.qa_pairer import pair_questions_answers
-
         result = pair_questions_answers(segments)
 
         assert result[0].paired_with == 2  # Skipped empty segment
@@ -378,8 +338,6 @@ class TestQAPairer:
             ),
         ]
 
-        from src.analysis.qa_pairer import pair_questions_answers
-
         result = pair_questions_answers(segments)
 
         assert result[0].paired_with == 1  # Question pairs to first answer
@@ -387,6 +345,28 @@ class TestQAPairer:
         assert result[2].paired_with == 0  # Second answer to question
         assert result[3].paired_with == 0  # Third answer to question
 
+    def test_pair_questions_answers_empty_interviewer_turn_closes_block(self):
+        """Even an empty interviewer turn stops answers pairing backwards."""
+        segments = [
+            AnalyzedSegment(
+                start=0, end=1, speaker="A", text="Question?", language="en",
+                segment_id=0, role="question", speaker_role="Interviewer",
+            ),
+            AnalyzedSegment(
+                start=1, end=2, speaker="A", text="", language="en",
+                segment_id=1, role="statement", speaker_role="Interviewer",
+            ),
+            AnalyzedSegment(
+                start=2, end=3, speaker="B", text="Answer here.", language="en",
+                segment_id=2, role="statement", speaker_role="Interviewee",
+            ),
+        ]
+
+        result = pair_questions_answers(segments)
+
+        assert result[0].paired_with is None  # Block closed before any answer
+        assert result[2].paired_with is None  # Answer has no open question
+
     def test_pair_questions_answers_interviewee_question_not_paired(self):
         """Test that questions from Interviewee are not paired as questions."""
         segments = [
@@ -400,8 +380,6 @@ class TestQAPairer:
             ),
         ]
 
-        from src.analysis.qa_pairer import pair_questions_answers
-
         result = pair_questions_answers(segments)
 
         assert result[0].paired_with == 1  # Question pairs to Interviewee segment
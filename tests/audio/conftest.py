@@ -0,0 +1,54 @@
+"""Fixtures compartidos para los tests de audio.
+
+The converter tests mostly just need a directory layout that already exists;
+building it per test is pure syscall overhead. The scaffold below is created
+once per test class and treated as read-only (subprocess/sf calls are mocked,
+so nothing ever writes into it). Tests that specifically need an empty
+directory keep their own ``tmp_path``.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.audio import converter
+
+
+@pytest.fixture(autouse=True)
+def _reset_converter_memo():
+    """Keep ensure_wav_audio's verified-WAV memo from leaking across tests."""
+    converter._verified_wavs.clear()
+
+
+@pytest.fixture(scope="class")
+def audio_scaffold(tmp_path_factory):
+    """Provision the raw/refined layout once and yield immutable paths.
+
+    - ``raw`` holds both an mp3 and an m4a (the mp3 wins on priority)
+    - ``m4a_dir`` holds only the m4a, for the fallback-format test
+    - ``wav`` points into ``refined`` but is never created
+    - ``existing_wav`` is a touched WAV for the already-converted tests
+    """
+    root = tmp_path_factory.mktemp("audio")
+    raw = root / "raw"
+    raw.mkdir()
+    (raw / "interview.mp3").touch()
+    (raw / "interview.m4a").touch()
+
+    m4a_dir = root / "m4a_only"
+    m4a_dir.mkdir()
+    (m4a_dir / "interview.m4a").touch()
+
+    refined = root / "refined"
+    refined.mkdir()
+    existing_wav = root / "existing" / "audio.wav"
+    existing_wav.parent.mkdir()
+    existing_wav.touch()
+
+    return SimpleNamespace(
+        root=root,
+        raw=raw,
+        m4a_dir=m4a_dir,
+        wav=refined / "audio.wav",
+        existing_wav=existing_wav,
+    )
@@ -2,125 +2,151 @@
 
 from unittest.mock import MagicMock
 
+import numpy as np
 import pytest
+from langdetect import LangDetectException
 
-from src.models.segment import Segment
+from src.models.segment import Segment, TranscribedSegment
+from src.audio.converter import convert_to_wav, ensure_wav_audio, find_audio_file
+from src.audio.diarizer import diarize_audio, write_rttm
+from src.audio.segmenter import split_audio_segments
+from src.audio.transcriber import (
+    _pack_segments,
+    _transcribe_pack,
+    detect_language,
+    transcribe_segments,
+)
 
+# Built once; the fallback test only needs *an* instance to raise
+_LD_ERR = LangDetectException(code=0, message="Error")
 
-class TestConverter:
-    """Tests for audio converter module."""
 
-    def test_find_audio_file_finds_mp3(self, tmp_path):
-        """Test finding MP3 file in directory."""
-        mp3_path = tmp_path / "interview.mp3"
-        mp3_path.touch()
+class TestConverter:
+    """Tests for audio converter module.
 
-        from src.audio.converter import find_audio_file
+    The shared class-scoped `audio_scaffold` is read-only: ffmpeg and
+    soundfile are always mocked, so no test writes into it.
+    """
 
-        result = find_audio_file(tmp_path)
+    def test_find_audio_file_finds_mp3(self, audio_scaffold):
+        """Test finding MP3 file in directory (wins over the m4a)."""
+        result = find_audio_file(audio_scaffold.raw)
 
-        assert result == mp3_path
+        assert result == audio_scaffold.raw / "interview.mp3"
 
-    def test_find_audio_file_finds_m4a(self, tmp_path):
+    def test_find_audio_file_finds_m4a(self, audio_scaffold):
         """Test finding M4A file in directory."""
-        m4a_path = tmp_path / "interview.m4a"
-        m4a_path.touch()
-
-        from src.audio.converter import find_audio_file
-
-        result = find_audio_file(tmp_path)
+        result = find_audio_file(audio_scaffold.m4a_dir)
 
-        assert result == m4a_path
+        assert result == audio_scaffold.m4a_dir / "interview.m4a"
 
     def test_find_audio_file_returns_none_when_empty(self, tmp_path):
         """Test returning None when no audio file found."""
-        from src.audio.converter import find_audio_file
-
         result = find_audio_file(tmp_path)
 
         assert result is None
 
-    def test_convert_to_wav_success(self, tmp_path, mocker):
+    def test_find_audio_file_returns_none_when_dir_missing(self, tmp_path):
+        """A raw_dir that doesn't exist yet reads as no audio, not a crash."""
+        result = find_audio_file(tmp_path / "raw")
+
+        assert result is None
+
+    def test_convert_to_wav_success(self, audio_scaffold, mocker):
         """Test successful audio to WAV conversion."""
-        source_path = tmp_path / "input.mp3"
-        wav_path = tmp_path / "output" / "audio.wav"
-        source_path.touch()
-
-        mock_audio = MagicMock()
-        mock_from_file = mocker.patch(
-            "src.audio.converter.AudioSegment.from_file",
-            return_value=mock_audio,
-        )
+        source_path = audio_scaffold.raw / "interview.mp3"
+        wav_path = audio_scaffold.wav
 
-        from src.audio.converter import convert_to_wav
+        mock_run = mocker.patch(
+            "src.audio.converter.subprocess.run",
+            return_value=MagicMock(returncode=0),
+        )
 
         result = convert_to_wav(source_path, wav_path)
 
         assert result is True
-        mock_from_file.assert_called_once_with(str(source_path), format="mp3")
-        mock_audio.export.assert_called_once_with(str(wav_path), format="wav")
+        mock_run.assert_called_once()
+        cmd = mock_run.call_args.args[0]
+        assert cmd[0] == "ffmpeg"
+        assert str(source_path) in cmd
+        assert str(wav_path) in cmd
 
-    def test_convert_to_wav_failure(self, tmp_path, mocker):
+    def test_convert_to_wav_failure(self, audio_scaffold, mocker):
         """Test conversion failure returns False."""
-        source_path = tmp_path / "input.mp3"
-        wav_path = tmp_path / "output.wav"
-
         mocker.patch(
-            "src.audio.converter.AudioSegment.from_file",
+            "src.audio.converter.subprocess.run",
             side_effect=Exception("Conversion failed"),
         )
 
-        from src.audio.converter import convert_to_wav
-
-        result = convert_to_wav(source_path, wav_path)
+        result = convert_to_wav(
+            audio_scaffold.raw / "interview.mp3", audio_scaffold.wav
+        )
 
         assert result is False
 
-    def test_convert_to_wav_unsupported_format(self, tmp_path):
+    def test_convert_to_wav_unsupported_format(self, audio_scaffold):
         """Test conversion fails for unsupported format."""
-        source_path = tmp_path / "input.xyz"
-        wav_path = tmp_path / "output.wav"
-        source_path.touch()
-
-        from src.audio.converter import convert_to_wav
+        source_path = audio_scaffold.root / "input.xyz"
 
-        result = convert_to_wav(source_path, wav_path)
+        result = convert_to_wav(source_path, audio_scaffold.wav)
 
         assert result is False
 
-    def test_ensure_wav_audio_wav_exists(self, tmp_path):
-        """Test that existing WAV file is detected."""
-        raw_dir = tmp_path / "raw"
-        raw_dir.mkdir()
-        wav_path = tmp_path / "refined" / "audio.wav"
-        wav_path.parent.mkdir(parents=True)
-        wav_path.touch()
+    def test_ensure_wav_audio_wav_exists(self, audio_scaffold, mocker):
+        """Test that an existing canonical WAV file is detected."""
+        mocker.patch(
+            "src.audio.converter.sf.info",
+            return_value=MagicMock(samplerate=16000, channels=1),
+        )
 
-        from src.audio.converter import ensure_wav_audio
+        result = ensure_wav_audio(audio_scaffold.raw, audio_scaffold.existing_wav)
 
-        result = ensure_wav_audio(raw_dir, wav_path)
+        assert result is True
+
+    def test_ensure_wav_audio_reconverts_non_canonical(self, audio_scaffold, mocker):
+        """Test that a WAV at the wrong rate is reconverted from the source."""
+        mocker.patch(
+            "src.audio.converter.sf.info",
+            return_value=MagicMock(samplerate=44100, channels=2),
+        )
+        mock_run = mocker.patch(
+            "src.audio.converter.subprocess.run",
+            return_value=MagicMock(returncode=0),
+        )
+
+        result = ensure_wav_audio(audio_scaffold.raw, audio_scaffold.existing_wav)
 
         assert result is True
+        mock_run.assert_called_once()
+        assert str(audio_scaffold.raw / "interview.mp3") in mock_run.call_args.args[0]
 
-    def test_ensure_wav_audio_converts_from_source(self, tmp_path, mocker):
+    def test_ensure_wav_audio_converts_from_source(self, audio_scaffold, mocker):
         """Test conversion when WAV doesn't exist but source does."""
-        raw_dir = tmp_path / "raw"
-        raw_dir.mkdir()
-        mp3_path = raw_dir / "audio.mp3"
-        mp3_path.touch()
-        wav_path = tmp_path / "refined" / "audio.wav"
+        mocker.patch(
+            "src.audio.converter.subprocess.run",
+            return_value=MagicMock(returncode=0),
+        )
+
+        result = ensure_wav_audio(audio_scaffold.raw, audio_scaffold.wav)
+
+        assert result is True
+
+    def test_ensure_wav_audio_cached(self, audio_scaffold, mocker):
+        """A verified WAV is remembered; the second call skips the filesystem."""
+        from pathlib import Path
 
-        mock_audio = MagicMock()
         mocker.patch(
-            "src.audio.converter.AudioSegment.from_file",
-            return_value=mock_audio,
+            "src.audio.converter.sf.info",
+            return_value=MagicMock(samplerate=16000, channels=1),
         )
+        assert ensure_wav_audio(audio_scaffold.raw, audio_scaffold.existing_wav)
 
-        from src.audio.converter import ensure_wav_audio
+        exists_spy = mocker.spy(Path, "exists")
 
-        result = ensure_wav_audio(raw_dir, wav_path)
+        result = ensure_wav_audio(audio_scaffold.raw, audio_scaffold.existing_wav)
 
         assert result is True
+        assert exists_spy.call_count == 0
 
     def test_ensure_wav_audio_no_files(self, tmp_path):
         """Test failure when no source files exist."""
@@ -128,8 +154,6 @@ class TestConverter:
         raw_dir.mkdir()
         wav_path = tmp_path / "refined" / "audio.wav"
 
-        from src.audio.converter import ensure_wav_audio
-
         result = ensure_wav_audio(raw_dir, wav_path)
 
         assert result is False
@@ -138,32 +162,44 @@ class TestConverter:
 class TestSegmenter:
     """Tests for audio segmenter module."""
 
+    def _patch_parallel_chunks(self, mocker, workers):
+        mock_settings = MagicMock()
+        mock_settings.audio.parallel_chunks = workers
+        mocker.patch(
+            "src.audio.segmenter.get_settings",
+            return_value=mock_settings,
+        )
+
+    def _patch_soundfile(self, mocker, duration_s=5.0, sample_rate=16000):
+        data = np.zeros((int(duration_s * sample_rate), 1), dtype=np.int16)
+        mocker.patch(
+            "src.audio.segmenter.sf.read",
+            return_value=(data, sample_rate),
+        )
+        return mocker.patch("src.audio.segmenter.sf.write")
+
     def test_split_audio_segments_creates_clips(self, tmp_path, mocker):
         """Test that segments are split into individual clips."""
         audio_path = tmp_path / "audio.wav"
         output_dir = tmp_path / "clips"
         audio_path.touch()
 
-        mock_audio = MagicMock()
-        mock_audio.__getitem__ = MagicMock(return_value=MagicMock())
-        mocker.patch(
-            "src.audio.segmenter.AudioSegment.from_wav",
-            return_value=mock_audio,
-        )
+        self._patch_parallel_chunks(mocker, 1)
+        mock_write = self._patch_soundfile(mocker)
 
         segments = [
             Segment(start=0.0, end=1.5, speaker="SPEAKER_00"),
             Segment(start=2.0, end=3.5, speaker="SPEAKER_01"),
         ]
 
-        from src.audio.segmenter import split_audio_segments
-
         result = split_audio_segments(audio_path, segments, output_dir)
 
         assert len(result) == 2
-        assert result[0] == output_dir / "part_0.wav"
-        assert result[1] == output_dir / "part_1.wav"
+        assert result[0][0] == output_dir / "part_0.wav"
+        assert result[1][0] == output_dir / "part_1.wav"
+        assert result[0][1].dtype == np.float32
         assert output_dir.exists()
+        assert mock_write.call_count == 2
 
     def test_split_audio_segments_correct_timestamps(self, tmp_path, mocker):
         """Test that correct time slices are extracted."""
@@ -171,21 +207,15 @@ class TestSegmenter:
         output_dir = tmp_path / "clips"
         audio_path.touch()
 
-        mock_clip = MagicMock()
-        mock_audio = MagicMock()
-        mock_audio.__getitem__ = MagicMock(return_value=mock_clip)
-        mocker.patch(
-            "src.audio.segmenter.AudioSegment.from_wav",
-            return_value=mock_audio,
-        )
+        self._patch_parallel_chunks(mocker, 1)
+        mock_write = self._patch_soundfile(mocker, sample_rate=16000)
 
         segments = [Segment(start=1.5, end=3.0, speaker="SPEAKER_00")]
 
-        from src.audio.segmenter import split_audio_segments
-
         split_audio_segments(audio_path, segments, output_dir)
 
-        mock_audio.__getitem__.assert_called_once_with(slice(1500, 3000))
+        clip = mock_write.call_args[0][1]
+        assert len(clip) == int(1.5 * 16000)
 
     def test_split_audio_segments_empty_list(self, tmp_path, mocker):
         """Test handling of empty segment list."""
@@ -193,17 +223,35 @@ class TestSegmenter:
         output_dir = tmp_path / "clips"
         audio_path.touch()
 
-        mock_audio = MagicMock()
-        mocker.patch(
-            "src.audio.segmenter.AudioSegment.from_wav",
-            return_value=mock_audio,
-        )
-
-        from src.audio.segmenter import split_audio_segments
+        self._patch_parallel_chunks(mocker, 1)
+        mock_read = mocker.patch("src.audio.segmenter.sf.read")
 
         result = split_audio_segments(audio_path, [], output_dir)
 
         assert result == []
+        mock_read.assert_not_called()
+
+    def test_split_audio_segments_parallel_writes(self, tmp_path, mocker):
+        """Test that parallel_chunks > 1 still writes every clip."""
+        audio_path = tmp_path / "audio.wav"
+        output_dir = tmp_path / "clips"
+        audio_path.touch()
+
+        self._patch_parallel_chunks(mocker, 4)
+        mock_write = self._patch_soundfile(mocker)
+
+        segments = [
+            Segment(start=0.0, end=1.5, speaker="SPEAKER_00"),
+            Segment(start=2.0, end=3.5, speaker="SPEAKER_01"),
+        ]
+
+        result = split_audio_segments(audio_path, segments, output_dir)
+
+        assert [path for path, _ in result] == [
+            output_dir / "part_0.wav",
+            output_dir / "part_1.wav",
+        ]
+        assert mock_write.call_count == 2
 
 
 class TestDiarizer:
@@ -217,8 +265,6 @@ class TestDiarizer:
         audio_path = tmp_path / "audio.wav"
         audio_path.touch()
 
-        from src.audio.diarizer import diarize_audio
-
         result = diarize_audio(audio_path)
 
         assert len(result) == 3
@@ -227,13 +273,9 @@ class TestDiarizer:
     def test_diarize_audio_raises_without_token(self, tmp_path, mocker):
         """Test that missing HF_TOKEN raises ValueError."""
         mocker.patch.dict("os.environ", {}, clear=True)
-        if "HF_TOKEN" in mocker.patch.dict("os.environ", {}).keys():
-            del mocker.patch.dict("os.environ", {})["HF_TOKEN"]
 
         audio_path = tmp_path / "audio.wav"
 
-        from src.audio.diarizer import diarize_audio
-
         with pytest.raises(ValueError, match="HF_TOKEN not found"):
             diarize_audio(audio_path, hf_token=None)
 
@@ -241,8 +283,6 @@ class TestDiarizer:
         """Test that RTTM file is created with correct format."""
         rttm_path = tmp_path / "output" / "diarization.rttm"
 
-        from src.audio.diarizer import write_rttm
-
         write_rttm(sample_segments, rttm_path, uri="test_audio")
 
         assert rttm_path.exists()
@@ -257,16 +297,13 @@ class TestTranscriber:
     """Tests for audio transcription module."""
 
     def test_transcribe_segments_returns_transcribed_segments(
-        self, tmp_path, mock_whisper, mock_pydub, mock_settings
+        self, tmp_path, mock_whisper, mock_settings
     ):
         """Test that transcription returns TranscribedSegment objects."""
         segments = [Segment(start=0.0, end=2.0, speaker="SPEAKER_00")]
         clip_paths = [tmp_path / "clip_0.wav"]
         clip_paths[0].touch()
 
-        from src.audio.transcriber import transcribe_segments
-        from src.models.segment import TranscribedSegment
-
         result, lang = transcribe_segments(segments, clip_paths)
 
         assert len(result) == 1
@@ -275,48 +312,80 @@ class TestTranscriber:
         assert lang == "en"
 
     def test_transcribe_segments_skips_short_clips(
-        self, tmp_path, mock_whisper, mock_settings, mocker
+        self, tmp_path, mock_whisper, mock_settings
     ):
         """Test that clips shorter than min_duration are skipped."""
-        mock_short_clip = MagicMock()
-        mock_short_clip.__len__ = MagicMock(return_value=50)  # 50ms
-        mocker.patch(
-            "src.audio.transcriber.AudioSegment.from_wav",
-            return_value=mock_short_clip,
-        )
-
         segments = [Segment(start=0.0, end=0.05, speaker="SPEAKER_00")]
         clip_paths = [tmp_path / "clip_0.wav"]
         clip_paths[0].touch()
 
-        from src.audio.transcriber import transcribe_segments
-
         result, _ = transcribe_segments(segments, clip_paths)
 
         assert result[0].text == ""
         mock_whisper.transcribe.assert_not_called()
 
+    def test_pack_segments_groups_same_speaker(self, tmp_path):
+        """Test that consecutive same-speaker clips share a pack."""
+        from pathlib import Path
+
+        segments = [
+            Segment(start=0.0, end=2.0, speaker="SPEAKER_00"),
+            Segment(start=2.0, end=4.0, speaker="SPEAKER_00"),
+            Segment(start=4.0, end=6.0, speaker="SPEAKER_01"),
+        ]
+        clips = [
+            (Path(f"part_{i}.wav"), np.zeros(32000, dtype=np.float32))
+            for i in range(3)
+        ]
+
+        packs = _pack_segments(segments, clips, min_duration=0.1, max_duration=28.0)
+
+        assert packs == [[0, 1], [2]]
+
+    def test_transcribe_pack_splits_words_by_offset(self, mock_settings):
+        """Test that pack words land on the clip they were spoken in."""
+        from pathlib import Path
+
+        segments = [
+            Segment(start=0.0, end=1.0, speaker="SPEAKER_00"),
+            Segment(start=1.0, end=2.0, speaker="SPEAKER_00"),
+        ]
+        # Two 1s clips at 16 kHz; the second starts at 1.1s inside the pack
+        clips = [
+            (Path("part_0.wav"), np.zeros(16000, dtype=np.float32)),
+            (Path("part_1.wav"), np.zeros(16000, dtype=np.float32)),
+        ]
+        mock_model = MagicMock()
+        mock_model.transcribe.return_value = {
+            "segments": [
+                {
+                    "words": [
+                        {"word": " Hello", "start": 0.2, "end": 0.5},
+                        {"word": " world", "start": 1.3, "end": 1.6},
+                    ]
+                }
+            ]
+        }
+
+        texts = _transcribe_pack(mock_model, segments, clips, [0, 1], "en")
+
+        assert texts == ["Hello", "world"]
+
     def test_detect_language_returns_detected(self, mocker):
         """Test language detection with valid text."""
         mocker.patch("src.audio.transcriber.detect", return_value="es")
 
-        from src.audio.transcriber import detect_language
-
         result = detect_language("Hola, ¿cómo estás?")
 
         assert result == "es"
 
     def test_detect_language_fallback_on_error(self, mocker):
         """Test language detection falls back to 'en' on error."""
-        from langdetect import LangDetectException
-
         mocker.patch(
             "src.audio.transcriber.detect",
-            side_effect=LangDetectException(code=0, message="Error"),
+            side_effect=_LD_ERR,
         )
 
-        from src.audio.transcriber import detect_language
-
         result = detect_language("")
 
         assert result == "en"
@@ -26,3 +26,34 @@ def test_setup_ffmpeg_path_exists(tmp_path):
 
     assert str(ffmpeg_dir) in os.environ['PATH']
     os.environ['PATH'] = original_path
+
+
+def test_setup_ffmpeg_repeat_call_does_not_grow_path(tmp_path):
+    """Test that calling setup twice leaves a single PATH entry."""
+    script_dir = tmp_path
+    ffmpeg_dir = (
+        script_dir / "engines" / "ffmpeg-2026-01-05-git-2892815c45-full_build" / "bin"
+    )
+    ffmpeg_dir.mkdir(parents=True)
+
+    original_path = os.environ.get('PATH', '')
+    setup_ffmpeg(script_dir)
+    setup_ffmpeg(script_dir)
+
+    assert os.environ['PATH'].split(os.pathsep).count(str(ffmpeg_dir)) == 1
+    os.environ['PATH'] = original_path
+
+
+def test_setup_ffmpeg_handles_version_drift(tmp_path):
+    """Test that a differently dated ffmpeg build is still found."""
+    script_dir = tmp_path
+    ffmpeg_dir = (
+        script_dir / "engines" / "ffmpeg-2030-06-15-git-deadbeef00-full_build" / "bin"
+    )
+    ffmpeg_dir.mkdir(parents=True)
+
+    original_path = os.environ.get('PATH', '')
+    setup_ffmpeg(script_dir)
+
+    assert str(ffmpeg_dir) in os.environ['PATH']
+    os.environ['PATH'] = original_path
@@ -30,3 +30,8 @@ def test_get_project_paths_structure(tmp_path):
     assert paths.raw_dir == tmp_path / "data" / "raw"
     assert paths.audio_wav == tmp_path / "data" / "refined" / "audio.wav"
     assert isinstance(paths.audio_wav, Path)
+
+
+def test_get_project_paths_is_cached(tmp_path):
+    """Test that repeat calls return the same cached instance."""
+    assert get_project_paths(tmp_path) is get_project_paths(tmp_path)
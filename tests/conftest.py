@@ -4,22 +4,59 @@ También incluye datos de ejemplo para usar en los tests."""
 
 
 
+import os
+import shutil
+import tempfile
+from collections import namedtuple
 from unittest.mock import MagicMock
 
+import numpy as np
 import pytest
 
 from src.models.segment import Segment, TranscribedSegment
 from src.models.analysis import SentimentResult, EmotionResult, AnalyzedSegment
+from src.models.interview import (
+    InterviewAnalysis,
+    InterviewMetadata,
+    InterviewReport,
+)
+
+
+def pytest_configure(config):
+    # tmp_path on RAM: the file-heavy tests (cleanup, save_analysis, the
+    # pipeline run) then never touch disk. Explicit --basetemp still wins.
+    # Each invocation gets its own directory — concurrent sessions must not
+    # share one, since pytest clears basetemp at session start — and
+    # pytest_unconfigure removes it again, so nothing leaks into /dev/shm.
+    shm = "/dev/shm"
+    if (
+        os.path.isdir(shm)
+        and os.access(shm, os.W_OK)
+        and not config.option.basetemp
+    ):
+        config.option.basetemp = tempfile.mkdtemp(dir=shm, prefix="pytest-")
+        config._shm_basetemp = config.option.basetemp
+
+
+def pytest_unconfigure(config):
+    basetemp = getattr(config, "_shm_basetemp", None)
+    if basetemp:
+        shutil.rmtree(basetemp, ignore_errors=True)
 
 
 # --- Sample Data Fixtures ---
+#
+# The segment/result models are frozen dataclasses, so the sample objects
+# are shared per session instead of being rebuilt for every test. Only
+# AnalyzedSegment is mutable (the pairer writes paired_with), so that
+# fixture hands each test its own model_copy of a session template.
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_segment():
     return Segment(start=0.0, end=1.5, speaker="SPEAKER_00")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_segments():
     return [
         Segment(start=0.0, end=2.0, speaker="SPEAKER_00"),
@@ -28,7 +65,7 @@ def sample_segments():
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_transcribed_segment():
     return TranscribedSegment(
         start=0.0,
@@ -39,7 +76,7 @@ def sample_transcribed_segment():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_transcribed_segments():
     return [
         TranscribedSegment(
@@ -57,7 +94,7 @@ def sample_transcribed_segments():
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_sentiment_result():
     return SentimentResult(
         label="POS",
@@ -66,7 +103,7 @@ def sample_sentiment_result():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_emotion_result():
     return EmotionResult(
         label="joy",
@@ -75,8 +112,8 @@ def sample_emotion_result():
     )
 
 
-@pytest.fixture
-def sample_analyzed_segment(sample_sentiment_result, sample_emotion_result):
+@pytest.fixture(scope="session")
+def _sample_analyzed_segment_template(sample_sentiment_result, sample_emotion_result):
     return AnalyzedSegment(
         start=0.0,
         end=2.0,
@@ -92,74 +129,179 @@ def sample_analyzed_segment(sample_sentiment_result, sample_emotion_result):
     )
 
 
+@pytest.fixture
+def sample_analyzed_segment(_sample_analyzed_segment_template):
+    # model_copy is the fast pydantic-core path: no re-validation
+    return _sample_analyzed_segment_template.model_copy()
+
+
+@pytest.fixture(scope="session")
+def canonical_analysis():
+    """One fully-built InterviewAnalysis shared by the save/roundtrip tests."""
+    metadata = InterviewMetadata(
+        date="2024-01-15", participants=["A"],
+        duration_seconds=100.0, language="en",
+    )
+    report = InterviewReport(
+        total_segments=0, total_questions=0, total_statements=0,
+        sentiment_distribution={}, emotion_distribution={},
+        average_sentiment_score=0.5,
+        dominant_sentiment="N/A", dominant_emotion="N/A",
+    )
+    return InterviewAnalysis(
+        interview_id="canonical-001", metadata=metadata, segments=[], report=report
+    )
+
+
+@pytest.fixture(scope="session")
+def canonical_analysis_json(canonical_analysis):
+    """The canonical analysis serialized once for the whole session."""
+    return canonical_analysis.model_dump_json()
+
+
 # --- Mock Fixtures for ML Models ---
+#
+# The MagicMock graphs are built once per session (they're read-only apart
+# from call history); the function-scoped fixtures below only do the
+# mocker.patch hookup, because mocker itself unpatches after every test.
 
-@pytest.fixture
-def mock_whisper(mocker):
-    """Mock whisper model and its transcribe method."""
+@pytest.fixture(scope="session")
+def _whisper_model_mock():
     mock_model = MagicMock()
     mock_model.transcribe.return_value = {
         "text": "This is transcribed text.",
         "language": "en",
     }
-    mock_load = mocker.patch("src.audio.transcriber.whisper.load_model")
-    mock_load.return_value = mock_model
+    mock_model.detect_language.return_value = (None, {"en": 0.99})
     return mock_model
 
 
 @pytest.fixture
-def mock_pyannote_pipeline(mocker):
-    """Mock pyannote speaker diarization pipeline."""
+def mock_whisper(mocker, _whisper_model_mock):
+    """Mock whisper model and its transcribe method."""
+    _whisper_model_mock.reset_mock()  # drop call history from earlier tests
+    mock_load = mocker.patch("src.audio.transcriber.whisper.load_model")
+    mock_load.return_value = _whisper_model_mock
+    mocker.patch("src.audio.transcriber.whisper.load_audio")
+    mocker.patch("src.audio.transcriber.whisper.pad_or_trim")
+    mocker.patch("src.audio.transcriber.whisper.log_mel_spectrogram")
+
+    from src.audio.transcriber import _get_model
+
+    _get_model.cache_clear()
+    return _whisper_model_mock
+
+
+# The diarizer only reads .start/.end off each turn, so plain named tuples
+# stand in for pyannote's Segment objects without any MagicMock setup
+_Turn = namedtuple("_Turn", "start end")
+_PYANNOTE_ITEMS = [
+    (_Turn(0.0, 2.0), "SPEAKER_00"),
+    (_Turn(2.1, 4.5), "SPEAKER_01"),
+    (_Turn(4.6, 6.0), "SPEAKER_00"),
+]
+
+
+@pytest.fixture(scope="session")
+def _pyannote_pipeline_mock():
     mock_annotation = MagicMock()
-    mock_annotation.__iter__ = lambda self: iter([
-        (MagicMock(start=0.0, end=2.0), "SPEAKER_00"),
-        (MagicMock(start=2.1, end=4.5), "SPEAKER_01"),
-        (MagicMock(start=4.6, end=6.0), "SPEAKER_00"),
-    ])
+    mock_annotation.__iter__ = lambda self: iter(_PYANNOTE_ITEMS)
 
     mock_output = MagicMock()
     mock_output.speaker_diarization = mock_annotation
 
     mock_pipeline = MagicMock()
     mock_pipeline.return_value = mock_output
-
-    mock_from_pretrained = mocker.patch("src.audio.diarizer.Pipeline.from_pretrained")
-    mock_from_pretrained.return_value = mock_pipeline
     return mock_pipeline
 
 
 @pytest.fixture
-def mock_pysentimiento(mocker):
-    """Mock pysentimiento analyzer."""
-    mock_result = MagicMock()
-    mock_result.output = "POS"
-    mock_result.probas = {"POS": 0.8, "NEG": 0.1, "NEU": 0.1}
+def mock_pyannote_pipeline(mocker, _pyannote_pipeline_mock):
+    """Mock pyannote speaker diarization pipeline."""
+    mock_from_pretrained = mocker.patch("src.audio.diarizer.Pipeline.from_pretrained")
+    mock_from_pretrained.return_value = _pyannote_pipeline_mock
+    return _pyannote_pipeline_mock
+
 
-    mock_analyzer = MagicMock()
-    mock_analyzer.predict.return_value = mock_result
+@pytest.fixture(scope="session")
+def shared_analyzer(session_mocker):
+    """One pysentimiento analyzer mock, patched in once for the whole session.
 
-    mock_create = mocker.patch("src.analysis.sentiment.create_analyzer")
-    mock_create.return_value = mock_analyzer
-    return mock_analyzer
+    Tests set `shared_analyzer.predict.return_value` instead of re-patching
+    create_analyzer; the analyzer registry then always caches this mock.
+    """
+    analyzer = MagicMock()
+    session_mocker.patch(
+        "src.analysis.sentiment.create_analyzer", return_value=analyzer
+    )
+    return analyzer
 
 
-@pytest.fixture
-def mock_soundfile(mocker):
-    """Mock soundfile.read for audio loading."""
-    import numpy as np
-    mock_read = mocker.patch("src.audio.diarizer.sf.read")
-    mock_read.return_value = (np.zeros(16000), 16000)
-    return mock_read
+@pytest.fixture(scope="session")
+def shared_classifier(session_mocker):
+    """One question-classifier mock, patched in once for the whole session.
+
+    Tests set `shared_classifier.return_value` to the desired score list;
+    the singleton loader always hands back this mock.
+    """
+    classifier = MagicMock()
+    session_mocker.patch(
+        "src.analysis.question_classifier.pipeline", return_value=classifier
+    )
+    return classifier
+
+
+@pytest.fixture(autouse=True)
+def _model_loader_mocks(shared_analyzer, shared_classifier):
+    """Keep the loader patches installed before any test runs."""
+
+
+@pytest.fixture(autouse=True)
+def _cache_root_in_tmp(tmp_path, monkeypatch):
+    """Point the disk result cache at tmp_path for every test.
+
+    Tests must never write into the repo checkout: cache entries under
+    data/cache would survive the run and turn later call-count assertions
+    into disk-cache hits.
+    """
+    monkeypatch.setattr(
+        "src.analysis.result_cache._cache_root", lambda: tmp_path / "cache"
+    )
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _stub_pipeline_progress(session_mocker):
+    """Stub the progress display once; every pipeline test wants it silenced."""
+    session_mocker.patch("src.pipeline.runner.pipeline_progress")
+
+
+# One second of silence, shared by every mocked read; the write=False flag
+# makes any accidental in-place mutation raise instead of leaking across tests
+_ZERO_AUDIO = np.zeros((16000, 1), dtype=np.float32)
+_ZERO_AUDIO.setflags(write=False)
+
+
+@pytest.fixture(scope="session")
+def _soundfile_cls_mock():
+    mock_file = MagicMock()
+    mock_file.samplerate = 16000
+    mock_file.read.return_value = _ZERO_AUDIO
+    mock_soundfile_cls = MagicMock()
+    mock_soundfile_cls.return_value.__enter__.return_value = mock_file
+    return mock_soundfile_cls
 
 
 @pytest.fixture
-def mock_pydub(mocker):
-    """Mock pydub AudioSegment for audio processing."""
-    mock_segment = MagicMock()
-    mock_segment.__len__ = lambda self: 2000  # 2 seconds in ms
-    mock_from_wav = mocker.patch("src.audio.transcriber.AudioSegment.from_wav")
-    mock_from_wav.return_value = mock_segment
-    return mock_from_wav
+def mock_soundfile(monkeypatch, _soundfile_cls_mock):
+    """Mock soundfile.SoundFile for audio loading.
+
+    Plain monkeypatch.setattr: this is a single-attribute swap with no
+    spy/call assertions, so pytest-mock's wrapper adds nothing here.
+    """
+    from src.audio import diarizer
+
+    monkeypatch.setattr(diarizer.sf, "SoundFile", _soundfile_cls_mock)
+    return _soundfile_cls_mock
 
 
 # --- File System Fixtures ---
@@ -183,15 +325,26 @@ def temp_project_structure(tmp_path):
 
 # --- Settings Fixtures ---
 
-@pytest.fixture
-def mock_settings(mocker):
-    """Mock settings with test defaults."""
+@pytest.fixture(scope="session")
+def _test_settings():
     from src.config.settings import Settings, AudioSettings, AnalysisSettings
 
-    settings = Settings(
-        audio=AudioSettings(whisper_model="tiny", min_segment_duration=0.1),
+    return Settings(
+        # whisper_backend pinned: the transcriber fixtures only mock
+        # whisper.load_model, and the "faster" default would construct a
+        # real WhisperModel wherever the [faster] extra is installed
+        audio=AudioSettings(
+            whisper_model="tiny",
+            whisper_backend="openai",
+            min_segment_duration=0.1,
+        ),
         analysis=AnalysisSettings(default_language="en"),
     )
-    mocker.patch("src.config.settings.get_settings", return_value=settings)
-    mocker.patch("src.audio.transcriber.get_settings", return_value=settings)
-    return settings
+
+
+@pytest.fixture
+def mock_settings(mocker, _test_settings):
+    """Mock settings with test defaults."""
+    mocker.patch("src.config.settings.get_settings", return_value=_test_settings)
+    mocker.patch("src.audio.transcriber.get_settings", return_value=_test_settings)
+    return _test_settings
@@ -1,216 +1,201 @@
 """Tests for pipeline runner including integration test."""
 
-from unittest.mock import MagicMock
+from types import SimpleNamespace
 
 import pytest
 
 from src.models.segment import Segment, TranscribedSegment
 from src.models.analysis import SentimentResult, EmotionResult
 from src.models.interview import InterviewAnalysis
+from src.pipeline import runner as runner_mod
+from src.pipeline.runner import run_pipeline
+
+
+# Immutable mock data, built once at import; the segment/result types are
+# frozen dataclasses, so tuples of them are safe to share everywhere
+_MOCK_SEGMENTS = (
+    Segment(start=0.0, end=2.0, speaker="SPEAKER_00"),
+    Segment(start=2.1, end=4.0, speaker="SPEAKER_01"),
+    Segment(start=4.1, end=6.0, speaker="SPEAKER_00"),
+)
+_MOCK_TRANSCRIBED = (
+    TranscribedSegment(
+        start=0.0, end=2.0, speaker="SPEAKER_00",
+        text="How are you feeling?", language="en"
+    ),
+    TranscribedSegment(
+        start=2.1, end=4.0, speaker="SPEAKER_01",
+        text="I feel great today!", language="en"
+    ),
+    TranscribedSegment(
+        start=4.1, end=6.0, speaker="SPEAKER_00",
+        text="That's wonderful.", language="en"
+    ),
+)
+_MOCK_SENTIMENT = SentimentResult(label="POS", score=0.9, probabilities={"POS": 0.9})
+_MOCK_EMOTION = EmotionResult(label="joy", score=0.8, probabilities={"joy": 0.8})
+_QUESTION_ROLES = {
+    "How are you feeling?": ("question", 0.9),
+    "I feel great today!": ("statement", 0.8),
+    "That's wonderful.": ("statement", 0.7),
+}
+
+
+@pytest.fixture(scope="module")
+def _mock_payload():
+    """Mock data for the integration tests; just hands out the constants."""
+    return {
+        "segments": _MOCK_SEGMENTS,
+        "transcribed": _MOCK_TRANSCRIBED,
+        "sentiment": _MOCK_SENTIMENT,
+        "emotion": _MOCK_EMOTION,
+        "question_roles": _QUESTION_ROLES,
+    }
+
+
+@pytest.fixture(scope="module")
+def pipeline_result(tmp_path_factory, _mock_payload, module_mocker):
+    """Run the fully mocked pipeline once; the happy-path tests only assert.
+
+    Returns the InterviewAnalysis plus the output path so the save test can
+    check the file. module_mocker keeps the patches alive for the module.
+    """
+    root = tmp_path_factory.mktemp("pipe")
+
+    module_mocker.patch.object(
+        runner_mod, "ensure_wav_audio",
+        return_value=True
+    )
+    module_mocker.patch.object(
+        runner_mod, "diarize_audio",
+        return_value=_mock_payload["segments"]
+    )
+    module_mocker.patch.object(
+        runner_mod, "split_audio_segments",
+        return_value=[root / f"part_{i}.wav" for i in range(3)]
+    )
+    module_mocker.patch.object(
+        runner_mod, "open_transcription_stream",
+        return_value=(iter(_mock_payload["transcribed"]), "en")
+    )
+    question_roles = _mock_payload["question_roles"]
+    module_mocker.patch.object(
+        runner_mod, "classify_questions",
+        side_effect=lambda texts: [question_roles[t] for t in texts]
+    )
+    analyzed = (_mock_payload["sentiment"], _mock_payload["emotion"])
+    module_mocker.patch.object(
+        runner_mod, "analyze_text_batch",
+        side_effect=lambda texts, lang: [analyzed for _ in texts]
+    )
+    # SimpleNamespace: run_pipeline only reads two attributes off the settings
+    module_mocker.patch.object(
+        runner_mod, "get_settings",
+        return_value=SimpleNamespace(
+            analysis=SimpleNamespace(default_language="auto", qc_batch_size=16)
+        )
+    )
+    module_mocker.patch.object(runner_mod, "warmup")
+
+    output_path = root / "output" / "analysis.json"
+    analysis = run_pipeline(
+        raw_dir=root / "raw",
+        audio_wav=root / "refined" / "audio.wav",
+        parts_dir=root / "parts",
+        output_path=output_path,
+        device="cpu",
+        interview_id="test-integration-001",
+    )
+    return analysis, output_path
+
+
+@pytest.fixture
+def pipeline_paths(tmp_path):
+    """The four run_pipeline path arguments, assembled once per test."""
+    return SimpleNamespace(
+        raw=tmp_path / "raw",
+        audio=tmp_path / "refined" / "a.wav",
+        parts=tmp_path / "parts",
+        out=tmp_path / "out.json",
+    )
+
+
+# Happy-path checks for the parametrized integration test below; each one
+# asserts a single aspect of the cached pipeline run
+def _check_returns_interview_analysis(result, output_path):
+    assert isinstance(result, InterviewAnalysis)
+    assert result.interview_id == "test-integration-001"
+
+
+def _check_segment_count(result, output_path):
+    assert len(result.segments) == 3
+    assert result.report.total_segments == 3
+
+
+def _check_question_classification(result, output_path):
+    assert result.report.total_questions == 1
+    assert result.report.total_statements == 2
+
+
+def _check_speaker_roles(result, output_path):
+    roles = {seg.speaker_role for seg in result.segments}
+    assert "Interviewer" in roles or "Interviewee" in roles
+
+
+def _check_output_file_saved(result, output_path):
+    assert output_path.exists()
 
 
 class TestRunPipelineIntegration:
     """Integration tests for the complete pipeline."""
 
-    @pytest.fixture
-    def mock_all_dependencies(self, tmp_path, mocker):
-        """Mock all external dependencies for integration testing."""
-        mock_segments = [
-            Segment(start=0.0, end=2.0, speaker="SPEAKER_00"),
-            Segment(start=2.1, end=4.0, speaker="SPEAKER_01"),
-            Segment(start=4.1, end=6.0, speaker="SPEAKER_00"),
-        ]
-
-        mock_transcribed = [
-            TranscribedSegment(
-                start=0.0, end=2.0, speaker="SPEAKER_00",
-                text="How are you feeling?", language="en"
-            ),
-            TranscribedSegment(
-                start=2.1, end=4.0, speaker="SPEAKER_01",
-                text="I feel great today!", language="en"
-            ),
-            TranscribedSegment(
-                start=4.1, end=6.0, speaker="SPEAKER_00",
-                text="That's wonderful.", language="en"
-            ),
-        ]
-
-        mock_sentiment = SentimentResult(
-            label="POS", score=0.9, probabilities={"POS": 0.9}
-        )
-        mock_emotion = EmotionResult(
-            label="joy", score=0.8, probabilities={"joy": 0.8}
-        )
-
-        mocker.patch(
-            "src.pipeline.runner.ensure_wav_audio",
-            return_value=True
-        )
-        mocker.patch(
-            "src.pipeline.runner.diarize_audio",
-            return_value=mock_segments
-        )
-        mocker.patch(
-            "src.pipeline.runner.split_audio_segments",
-            return_value=[tmp_path / f"part_{i}.wav" for i in range(3)]
-        )
-        mocker.patch(
-            "src.pipeline.runner.transcribe_segments",
-            return_value=(mock_transcribed, "en")
-        )
-        mocker.patch(
-            "src.pipeline.runner.classify_question",
-            side_effect=[("question", 0.9), ("statement", 0.8), ("statement", 0.7)]
-        )
-        mocker.patch(
-            "src.pipeline.runner.analyze_text",
-            return_value=(mock_sentiment, mock_emotion)
-        )
-
-        mocker.patch(
-            "src.pipeline.runner.get_settings",
-            return_value=MagicMock(
-                analysis=MagicMock(default_language="auto")
-            )
-        )
-
-        mocker.patch("src.pipeline.runner.pipeline_progress")
-
-        return {
-            "segments": mock_segments,
-            "transcribed": mock_transcribed,
-        }
-
-    def test_run_pipeline_returns_interview_analysis(
-        self, tmp_path, mock_all_dependencies
+    # Keep these on one xdist worker (--dist loadgroup) so the cached
+    # pipeline run and its module-scoped patches are built exactly once
+    pytestmark = pytest.mark.xdist_group(name="pipeline_integration")
+
+    @pytest.mark.parametrize(
+        "check",
+        [
+            _check_returns_interview_analysis,
+            _check_segment_count,
+            _check_question_classification,
+            _check_speaker_roles,
+            _check_output_file_saved,
+        ],
+        ids=[
+            "returns-interview-analysis",
+            "segment-count",
+            "question-classification",
+            "speaker-roles",
+            "saves-output-file",
+        ],
+    )
+    def test_run_pipeline_happy_path(self, pipeline_result, check):
+        """Test the cached successful run, one assertion group per id."""
+        result, output_path = pipeline_result
+
+        check(result, output_path)
+
+    @pytest.mark.parametrize(
+        ("wav_ok", "diarized"),
+        [
+            pytest.param(False, None, id="audio-failure"),
+            pytest.param(True, [], id="empty-diarization"),
+        ],
+    )
+    def test_run_pipeline_returns_none_on_failure(
+        self, pipeline_paths, mocker, wav_ok, diarized
     ):
-        """Test that pipeline returns InterviewAnalysis on success."""
-        from src.pipeline.runner import run_pipeline
-
-        raw_dir = tmp_path / "raw"
-        raw_dir.mkdir()
-        audio_wav = tmp_path / "refined" / "audio.wav"
-        parts_dir = tmp_path / "parts"
-        output_path = tmp_path / "output" / "analysis.json"
+        """Test that audio or diarization failures abort with None."""
+        mocker.patch.object(runner_mod, "ensure_wav_audio", return_value=wav_ok)
+        mocker.patch.object(runner_mod, "diarize_audio", return_value=diarized)
+        mocker.patch.object(runner_mod, "get_settings")
 
         result = run_pipeline(
-            raw_dir=raw_dir,
-            audio_wav=audio_wav,
-            parts_dir=parts_dir,
-            output_path=output_path,
-            device="cpu",
-            interview_id="test-integration-001",
-        )
-
-        assert isinstance(result, InterviewAnalysis)
-        assert result.interview_id == "test-integration-001"
-
-    def test_run_pipeline_produces_correct_segment_count(
-        self, tmp_path, mock_all_dependencies
-    ):
-        """Test that pipeline processes all segments."""
-        from src.pipeline.runner import run_pipeline
-
-        result = run_pipeline(
-            raw_dir=tmp_path / "raw",
-            audio_wav=tmp_path / "refined" / "a.wav",
-            parts_dir=tmp_path / "parts",
-            output_path=tmp_path / "out.json",
-        )
-
-        assert len(result.segments) == 3
-        assert result.report.total_segments == 3
-
-    def test_run_pipeline_classifies_questions_and_statements(
-        self, tmp_path, mock_all_dependencies
-    ):
-        """Test question/statement classification."""
-        from src.pipeline.runner import run_pipeline
-
-        result = run_pipeline(
-            raw_dir=tmp_path / "raw",
-            audio_wav=tmp_path / "refined" / "a.wav",
-            parts_dir=tmp_path / "parts",
-            output_path=tmp_path / "out.json",
-        )
-
-        assert result.report.total_questions == 1
-        assert result.report.total_statements == 2
-
-    def test_run_pipeline_maps_speaker_roles(
-        self, tmp_path, mock_all_dependencies
-    ):
-        """Test that speakers are mapped to roles."""
-        from src.pipeline.runner import run_pipeline
-
-        result = run_pipeline(
-            raw_dir=tmp_path / "raw",
-            audio_wav=tmp_path / "refined" / "a.wav",
-            parts_dir=tmp_path / "parts",
-            output_path=tmp_path / "out.json",
-        )
-
-        roles = {seg.speaker_role for seg in result.segments}
-        assert "Interviewer" in roles or "Interviewee" in roles
-
-    def test_run_pipeline_saves_output_file(
-        self, tmp_path, mock_all_dependencies
-    ):
-        """Test that output file is created."""
-        from src.pipeline.runner import run_pipeline
-
-        output_path = tmp_path / "output" / "analysis.json"
-
-        run_pipeline(
-            raw_dir=tmp_path / "raw",
-            audio_wav=tmp_path / "refined" / "a.wav",
-            parts_dir=tmp_path / "parts",
-            output_path=output_path,
-        )
-
-        assert output_path.exists()
-
-    def test_run_pipeline_returns_none_on_audio_failure(self, tmp_path, mocker):
-        """Test that pipeline returns None when audio conversion fails."""
-        mocker.patch(
-            "src.pipeline.runner.ensure_wav_audio",
-            return_value=False
-        )
-        mocker.patch("src.pipeline.runner.pipeline_progress")
-        mocker.patch("src.pipeline.runner.get_settings")
-
-        from src.pipeline.runner import run_pipeline
-
-        result = run_pipeline(
-            raw_dir=tmp_path / "raw",
-            audio_wav=tmp_path / "refined" / "a.wav",
-            parts_dir=tmp_path / "parts",
-            output_path=tmp_path / "out.json",
-        )
-
-        assert result is None
-
-    def test_run_pipeline_returns_none_on_empty_diarization(self, tmp_path, mocker):
-        """Test that pipeline returns None when diarization finds no speakers."""
-        mocker.patch(
-            "src.pipeline.runner.ensure_wav_audio",
-            return_value=True
-        )
-        mocker.patch(
-            "src.pipeline.runner.diarize_audio",
-            return_value=[]
-        )
-        mocker.patch("src.pipeline.runner.pipeline_progress")
-        mocker.patch("src.pipeline.runner.get_settings")
-
-        from src.pipeline.runner import run_pipeline
-
-        result = run_pipeline(
-            raw_dir=tmp_path / "raw",
-            audio_wav=tmp_path / "refined" / "a.wav",
-            parts_dir=tmp_path / "parts",
-            output_path=tmp_path / "out.json",
+            raw_dir=pipeline_paths.raw,
+            audio_wav=pipeline_paths.audio,
+            parts_dir=pipeline_paths.parts,
+            output_path=pipeline_paths.out,
         )
 
         assert result is None
@@ -219,10 +204,12 @@ class TestRunPipelineIntegration:
 class TestPipelineImports:
     """Basic import tests for pipeline module."""
 
+    # Pure does-the-package-load checks; run alone with `pytest -m smoke`
+    # or leave out of the main matrix with `pytest -m "not smoke"`
+    pytestmark = pytest.mark.smoke
+
     def test_run_pipeline_is_callable(self):
         """Test that run_pipeline can be imported."""
-        from src.pipeline.runner import run_pipeline
-
         assert callable(run_pipeline)
 
     def test_import_pipeline_module(self):
@@ -1,11 +1,28 @@
 """Tests for utils.cleanup module."""
 
+import os
+
+import pytest
+
 from src.utils.cleanup import cleanup_folders
 
 
-def test_cleanup_creates_interim_folder(tmp_path):
+@pytest.fixture(scope="session")
+def cleanup_base(tmp_path_factory):
+    """One parent directory for all cleanup tests, torn down at session end."""
+    return tmp_path_factory.mktemp("cleanup_tests")
+
+
+@pytest.fixture
+def script_dir(cleanup_base, request):
+    """Per-test subtree under the shared base; no per-test rmtree teardown."""
+    path = cleanup_base / request.node.name
+    path.mkdir()
+    return path
+
+
+def test_cleanup_creates_interim_folder(script_dir):
     """Test that interim folder is created."""
-    script_dir = tmp_path
     interim_dir = script_dir / "data" / "interim"
 
     cleanup_folders(script_dir)
@@ -14,13 +31,12 @@ def test_cleanup_creates_interim_folder(tmp_path):
     assert interim_dir.is_dir()
 
 
-def test_cleanup_removes_files_from_interim(tmp_path):
+def test_cleanup_removes_files_from_interim(script_dir):
     """Test that files are removed from interim folder."""
-    script_dir = tmp_path
     interim_dir = script_dir / "data" / "interim"
-    interim_dir.mkdir(parents=True)
+    os.makedirs(interim_dir)  # one C-level walk instead of pathlib recursion
     test_file = interim_dir / "test.rttm"
-    test_file.write_text("test content")
+    test_file.touch()  # sentinel only; nothing reads it back
 
     cleanup_folders(script_dir)
 
@@ -28,18 +44,15 @@ def test_cleanup_removes_files_from_interim(tmp_path):
     assert not test_file.exists()
 
 
-def test_cleanup_removes_specific_output_files(tmp_path):
+@pytest.mark.parametrize(
+    "filename", ["audio_diarizado.json", "transcriptions.json"]
+)
+def test_cleanup_removes_specific_output_files(script_dir, filename):
     """Test that specific output files are removed."""
-    script_dir = tmp_path
     output_dir = script_dir / "data" / "output"
-    output_dir.mkdir(parents=True)
-
-    files_to_clean = ["audio_diarizado.json", "transcriptions.json"]
-
-    for filename in files_to_clean:
-        (output_dir / filename).write_text("test")
+    os.makedirs(output_dir)
+    (output_dir / filename).touch()
 
     cleanup_folders(script_dir)
 
-    for filename in files_to_clean:
-        assert not (output_dir / filename).exists()
+    assert not (output_dir / filename).exists()